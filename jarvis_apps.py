@@ -0,0 +1,249 @@
+"""
+J.A.R.V.I.S. application catalog
+Resolve app names to executables once, launch them without a shell
+"""
+
+import os
+import re
+import json
+import time
+import shlex
+import shutil
+import platform
+import threading
+import subprocess
+from typing import Dict, Any, List, Optional
+
+try:
+    import winreg
+    WINREG_AVAILABLE = True
+except ImportError:
+    WINREG_AVAILABLE = False
+
+CATALOG_FILE = os.path.join(os.path.expanduser('~'), '.jarvis', 'apps.json')
+CATALOG_VERSION = 1
+
+APP_PATHS_KEY = r'SOFTWARE\Microsoft\Windows\CurrentVersion\App Paths'
+
+# Exec= field codes from the desktop entry spec
+DESKTOP_FIELD_CODES = re.compile(r'\s*%[fFuUdDnNickvm]')
+
+
+class AppCatalog:
+    def __init__(self, path: str = CATALOG_FILE, refresh_interval: float = 6 * 3600):
+        self.path = path
+        self.refresh_interval = refresh_interval
+        self.os = platform.system()
+        self.apps: Dict[str, Dict[str, Any]] = {}
+        self.built = 0.0
+        self._refresh_lock = threading.Lock()
+        self._thread = None
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        name = name.lower().strip()
+        stem, ext = os.path.splitext(name)
+        if ext in ('.exe', '.lnk', '.desktop', '.bat', '.cmd', '.com'):
+            name = stem
+        return name
+
+    def lookup(self, name: str) -> Optional[Dict[str, Any]]:
+        """Resolved entry for an app name, or None"""
+        return self.apps.get(self.normalize(name))
+
+    def resolve(self, name: str) -> Optional[Dict[str, Any]]:
+        """Catalog lookup, falling back to PATH for apps installed since the last scan.
+
+        The fallback only takes bare names, so request text can never point
+        at an arbitrary path. Hits are not cached; the next refresh picks
+        them up.
+        """
+        entry = self.lookup(name)
+        if entry is None and self.is_bare_name(name):
+            exe = shutil.which(name)
+            if exe:
+                entry = {"kind": "exe", "argv": [exe]}
+        return entry
+
+    @staticmethod
+    def is_bare_name(name: str) -> bool:
+        """True for a plain program name with no path or drive component"""
+        # Check both separators regardless of platform (os.sep / os.altsep)
+        if not name or name.startswith('.') or ':' in name:
+            return False
+        return '/' not in name and '\\' not in name
+
+    def launch(self, entry: Dict[str, Any], args: Optional[List[str]] = None) -> Optional[subprocess.Popen]:
+        """Start a catalog entry directly, never through a shell"""
+        args = args or []
+        if entry['kind'] in ('shortcut', 'uri'):
+            if self.os == 'Windows':
+                os.startfile(entry['target'])
+                return None
+            return subprocess.Popen(['xdg-open', entry['target']],
+                                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return subprocess.Popen(entry['argv'] + args, stdin=subprocess.DEVNULL,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                close_fds=True, start_new_session=self.os != 'Windows')
+
+    def load(self) -> bool:
+        """Load the persisted catalog, returns False if missing or stale format"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if cached.get('version') != CATALOG_VERSION:
+            return False
+        self.apps = cached['apps']
+        self.built = cached.get('built', 0.0)
+        return True
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({"version": CATALOG_VERSION, "built": self.built, "apps": self.apps}, f)
+        os.replace(tmp, self.path)
+
+    def refresh(self):
+        """Rescan the system and swap in the new catalog"""
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            apps: Dict[str, Dict[str, Any]] = {}
+            if self.os == 'Windows':
+                self._scan_app_paths(apps)
+                self._scan_path(apps)
+                self._scan_start_menu(apps)
+            else:
+                self._scan_path(apps)
+                self._scan_desktop_files(apps)
+            self.apps = apps
+            self.built = time.time()
+            try:
+                self.save()
+            except OSError:
+                pass
+        finally:
+            self._refresh_lock.release()
+
+    def start(self):
+        """Load the cached catalog now, rescan in a background thread"""
+        self.load()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._refresh_loop, name='jarvis-app-catalog', daemon=True)
+            self._thread.start()
+
+    def _refresh_loop(self):
+        self.refresh()
+        while self.refresh_interval > 0:
+            time.sleep(self.refresh_interval)
+            self.refresh()
+
+    def _scan_path(self, apps: Dict[str, Dict[str, Any]]):
+        if self.os == 'Windows':
+            exts = [e.lower() for e in os.environ.get('PATHEXT', '.EXE;.BAT;.CMD;.COM').split(';') if e]
+        for directory in os.environ.get('PATH', '').split(os.pathsep):
+            if not directory:
+                continue
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            if not entry.is_file():
+                                continue
+                        except OSError:
+                            continue
+                        if self.os == 'Windows':
+                            if os.path.splitext(entry.name)[1].lower() not in exts:
+                                continue
+                        elif not os.access(entry.path, os.X_OK):
+                            continue
+                        apps.setdefault(self.normalize(entry.name), {"kind": "exe", "argv": [entry.path]})
+            except OSError:
+                continue
+
+    def _scan_app_paths(self, apps: Dict[str, Dict[str, Any]]):
+        if not WINREG_AVAILABLE:
+            return
+        for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+            try:
+                root = winreg.OpenKey(hive, APP_PATHS_KEY)
+            except OSError:
+                continue
+            with root:
+                index = 0
+                while True:
+                    try:
+                        name = winreg.EnumKey(root, index)
+                    except OSError:
+                        break
+                    index += 1
+                    try:
+                        with winreg.OpenKey(root, name) as key:
+                            exe = winreg.QueryValue(key, None)
+                    except OSError:
+                        continue
+                    exe = os.path.expandvars(exe.strip().strip('"'))
+                    if exe and os.path.isfile(exe):
+                        apps.setdefault(self.normalize(name), {"kind": "exe", "argv": [exe]})
+
+    def _scan_start_menu(self, apps: Dict[str, Dict[str, Any]]):
+        roots = [os.path.join(os.environ.get(var, ''), 'Microsoft', 'Windows', 'Start Menu', 'Programs')
+                 for var in ('APPDATA', 'PROGRAMDATA')]
+        for root in roots:
+            if not os.path.isdir(root):
+                continue
+            for dirpath, _, files in os.walk(root):
+                for filename in files:
+                    if filename.lower().endswith('.lnk'):
+                        apps.setdefault(self.normalize(filename),
+                                        {"kind": "shortcut", "target": os.path.join(dirpath, filename)})
+
+    def _scan_desktop_files(self, apps: Dict[str, Dict[str, Any]]):
+        data_dirs = [os.environ.get('XDG_DATA_HOME', os.path.join(os.path.expanduser('~'), '.local', 'share'))]
+        data_dirs += os.environ.get('XDG_DATA_DIRS', '/usr/local/share:/usr/share').split(':')
+        for data_dir in data_dirs:
+            directory = os.path.join(data_dir, 'applications')
+            if not os.path.isdir(directory):
+                continue
+            for dirpath, _, files in os.walk(directory):
+                for filename in files:
+                    if filename.endswith('.desktop'):
+                        self._add_desktop_file(apps, os.path.join(dirpath, filename))
+
+    def _add_desktop_file(self, apps: Dict[str, Dict[str, Any]], path: str):
+        fields = {}
+        in_entry = False
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                for line in f:
+                    line = line.strip()
+                    if line.startswith('['):
+                        in_entry = line == '[Desktop Entry]'
+                    elif in_entry and '=' in line:
+                        key, value = line.split('=', 1)
+                        fields.setdefault(key.strip(), value.strip())
+        except OSError:
+            return
+        if fields.get('Type', 'Application') != 'Application' or fields.get('Hidden') == 'true':
+            return
+        exec_line = DESKTOP_FIELD_CODES.sub('', fields.get('Exec', '')).replace('%%', '%')
+        try:
+            argv = shlex.split(exec_line)
+        except ValueError:
+            return
+        if not argv:
+            return
+        exe = shutil.which(argv[0])
+        if not exe:
+            return
+        entry = {"kind": "exe", "argv": [exe] + argv[1:]}
+        for name in (fields.get('Name'), os.path.basename(path)):
+            if name:
+                apps.setdefault(self.normalize(name), entry)
+
+
+# Shared catalog used by JarvisCore
+app_catalog = AppCatalog()
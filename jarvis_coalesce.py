@@ -0,0 +1,106 @@
+"""
+J.A.R.V.I.S. command coalescing
+Share one execution between duplicate commands from the same client
+"""
+
+import re
+import time
+import threading
+from typing import Dict, Any, Callable, Optional, Tuple
+from jarvis_result import CommandResult, Intent
+
+# Window (seconds) in which an identical command reuses the previous result
+DEFAULT_WINDOW = 0.5
+
+# Longer debounce windows for intents with side effects, keyed by handler
+DEFAULT_DEBOUNCE = {
+    '_handle_youtube': 3.0,
+    '_open_website': 3.0,
+    '_handle_google_search': 3.0,
+    '_open_app': 2.0,
+    '_take_screenshot': 1.5,
+    '_handle_volume': 1.0,
+    '_handle_brightness': 1.0,
+    '_handle_media': 1.0,
+    '_write_text': 1.5,
+    '_press_key': 1.0,
+    '_create_folder': 2.0,
+    '_shutdown_system': 5.0
+}
+
+
+class _Entry:
+    __slots__ = ('event', 'result', 'finished', 'window')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.finished = None
+        self.window = 0.0
+
+
+class CommandCoalescer:
+    def __init__(self, execute: Callable[[str], CommandResult],
+                 window: float = DEFAULT_WINDOW, debounce: Optional[Dict[str, float]] = None):
+        self.execute = execute
+        self.window = window
+        self.debounce = dict(DEFAULT_DEBOUNCE if debounce is None else debounce)
+        self.stats = {"executed": 0, "coalesced": 0, "debounced": 0}
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(command: str) -> str:
+        """Lowercase, collapse whitespace, drop trailing punctuation from speech engines"""
+        return re.sub(r'\s+', ' ', command.lower()).strip().rstrip('.!?,')
+
+    def submit(self, client: str, command: str) -> Tuple[CommandResult, bool]:
+        """Run command, or join an identical in-flight/recent one.
+
+        Returns (result, coalesced).
+        """
+        key = (client, self.normalize(command))
+        now = time.monotonic()
+        with self._lock:
+            self._prune(now)
+            entry = self._entries.get(key)
+            leader = entry is None
+            if leader:
+                entry = _Entry()
+                self._entries[key] = entry
+                self.stats["executed"] += 1
+            elif entry.finished is None:
+                self.stats["coalesced"] += 1
+            else:
+                self.stats["debounced"] += 1
+
+        if not leader:
+            entry.event.wait()
+            return entry.result, True
+
+        try:
+            entry.result = self.execute(command)
+        except Exception as e:
+            entry.result = CommandResult.fail(Intent.ERROR, str(e))
+        finally:
+            # The debounce window comes from the handler that actually ran,
+            # so no routing or classification happens under the lock
+            window = self._window_for(getattr(entry.result, 'handler', None))
+            with self._lock:
+                entry.window = window
+                entry.finished = time.monotonic()
+            entry.event.set()
+        return entry.result, False
+
+    def _window_for(self, handler: Optional[str]) -> float:
+        return max(self.window, self.debounce.get(handler, 0.0))
+
+    def _prune(self, now: float):
+        expired = [k for k, e in self._entries.items()
+                   if e.finished is not None and now - e.finished >= e.window]
+        for k in expired:
+            del self._entries[k]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats, tracked=len(self._entries))
@@ -8,8 +8,15 @@ import random
 import urllib.parse
 import time
 import platform
+import threading
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Tuple, Optional
+from jarvis_search import file_search
+from jarvis_screenshot import screenshots, scope_note
+from jarvis_macros import MacroManager
+from jarvis_result import CommandResult, Intent, ErrorCode
+from jarvis_apps import app_catalog
+from jarvis_intent import intent_classifier
 
 # Optional imports with fallbacks
 try:
@@ -33,101 +40,241 @@ try:
 except ImportError:
     WINDOWS_API_AVAILABLE = False
 
+APP_ALIASES = {
+    'notepad': 'notepad.exe',
+    'calc': 'calc.exe',
+    'calculator': 'calc.exe',
+    'chrome': 'chrome.exe',
+    'browser': 'chrome.exe',
+    'edge': 'msedge.exe',
+    'firefox': 'firefox.exe',
+    'cmd': 'cmd.exe',
+    'command prompt': 'cmd.exe',
+    'powershell': 'powershell.exe',
+    'explorer': 'explorer.exe',
+    'files': 'explorer.exe',
+    'task manager': 'taskmgr.exe',
+    'paint': 'mspaint.exe',
+    'word': 'winword.exe',
+    'excel': 'excel.exe',
+    'spotify': 'spotify.exe',
+    'settings': 'ms-settings:',
+    'control panel': 'control.exe',
+    'vscode': 'code.exe',
+    'visual studio code': 'code.exe',
+    'vlc': 'vlc.exe',
+    'discord': 'discord.exe',
+    'steam': 'steam.exe'
+}
+
+# Replies that confirm a side-effecting intent the classifier asked about
+CONFIRM_WORDS = frozenset(['yes', 'yes please', 'confirm', 'do it', 'go ahead'])
+CONFIRM_TIMEOUT = 15.0
+
+# Every handler name _route() can return; macro steps are validated against it
+ROUTED_HANDLERS = frozenset([
+    '_handle_youtube', '_open_website', '_handle_google_search', '_open_app', '_handle_close',
+    '_minimize_all', '_snap_window', '_handle_brightness', '_handle_media', '_lock_system',
+    '_empty_recycle_bin', '_handle_window_actions', '_create_folder', '_delete_file',
+    '_rename_file', '_write_text', '_press_key', '_calculate', '_tell_joke', '_get_weather',
+    '_shutdown_system', '_abort_shutdown', '_list_processes', '_kill_process', '_get_time',
+    '_get_network', '_get_system_info', '_handle_clipboard', '_search_files', '_handle_volume',
+    '_take_screenshot', '_power_control', '_greeting', '_unknown'
+])
+
 class JarvisCore:
     def __init__(self):
         self.os = platform.system()
         self.last_result = None
         self.window_list = []
+        self.macros = MacroManager(ROUTED_HANDLERS)
+        # (canonical command, confidence, expiry) awaiting a spoken "yes"
+        self.pending_intent = None
+        app_catalog.start()
+        # Warm the classifier off the request path
+        threading.Thread(target=intent_classifier.load, daemon=True).start()
         
-    def process_command(self, command: str) -> Dict[str, Any]:
+    def process_command(self, command: str) -> CommandResult:
         """Main command processor"""
         cmd = command.lower().strip()
-        result = {"success": False, "action": None, "message": "Command not recognized", "data": None}
+        handler = None
+        started = time.perf_counter()
         
         try:
-            # Command routing - ordered by priority
-            if 'youtube' in cmd or ('play' in cmd and ('video' in cmd or 'song' in cmd or 'music' in cmd)):
-                result = self._handle_youtube(cmd)
-            elif 'go to' in cmd or 'visit' in cmd:
-                result = self._open_website(cmd)
-            elif cmd.startswith('search google for') or cmd.startswith('google search'):
-                query = cmd.replace('search google for', '').replace('google search', '').strip()
-                result = self._handle_google_search(query)
-            elif 'search' in cmd and 'google' in cmd:
-                query = cmd.replace('search', '').replace('google', '').replace('for', '').strip()
-                result = self._handle_google_search(query)
-            elif any(x in cmd for x in ['open', 'start', 'launch']):
-                result = self._handle_open(cmd)
-            elif cmd.startswith('close') or cmd.startswith('kill') or cmd.startswith('exit'):
-                result = self._handle_close(cmd)
-            elif 'minimize all' in cmd or 'show desktop' in cmd:
-                result = self._minimize_all()
-            elif 'snap' in cmd:
-                result = self._handle_snap(cmd)
-            elif 'brightness' in cmd:
-                result = self._handle_brightness(cmd)
-            elif any(x in cmd for x in ['play', 'pause', 'music', 'media', 'skip', 'next track', 'previous track']) and 'youtube' not in cmd:
-                result = self._handle_media(cmd)
-            elif 'lock' in cmd and 'system' in cmd:
-                result = self._lock_system()
-            elif 'empty recycle' in cmd or 'empty bin' in cmd:
-                result = self._empty_recycle_bin()
-            elif any(x in cmd for x in ['always on top', 'maximize window', 'minimize window', 'restore window']) and 'snap' not in cmd:
-                result = self._handle_window_actions(cmd)
-            elif 'create folder' in cmd or 'new folder' in cmd:
-                result = self._create_folder(cmd)
-            elif cmd.startswith('delete') or cmd.startswith('remove'):
-                result = self._delete_file(cmd)
-            elif 'rename' in cmd and ' to ' in cmd:
-                result = self._rename_file(cmd)
-            elif cmd.startswith('type') or cmd.startswith('write'):
-                result = self._write_text(cmd)
-            elif cmd.startswith('press') or cmd.startswith('hit'):
-                result = self._press_key(cmd)
-            elif any(x in cmd for x in ['calculate', 'compute']) or (any(x in cmd for x in ['what is', 'how much']) and any(c in cmd for c in '0123456789+-*/')):
-                result = self._calculate(cmd)
-            elif 'joke' in cmd:
-                result = self._tell_joke()
-            elif 'weather' in cmd:
-                result = self._get_weather(cmd)
-            elif any(x in cmd for x in ['shutdown', 'restart', 'reboot']) and 'abort' not in cmd:
-                result = self._shutdown_system(cmd)
-            elif 'abort' in cmd or 'cancel shutdown' in cmd:
-                result = self._abort_shutdown()
-            elif 'list processes' in cmd or 'running apps' in cmd:
-                result = self._list_processes()
-            elif cmd.startswith('terminate') or (cmd.startswith('kill') and 'close' not in cmd):
-                result = self._kill_process(cmd)
-            elif 'time' in cmd:
-                result = self._get_time()
-            elif 'ip' in cmd or 'network' in cmd:
-                result = self._get_network()
-            elif 'system info' in cmd:
-                result = self._get_system_info()
-            elif 'copy' in cmd and cmd.split()[0] == 'copy':
-                result = self._handle_clipboard(cmd, 'copy')
-            elif 'paste' in cmd:
-                result = self._handle_clipboard(cmd, 'paste')
-            elif 'find' in cmd or 'search file' in cmd:
-                result = self._search_files(cmd)
-            elif 'volume' in cmd or 'sound' in cmd:
-                result = self._handle_volume(cmd)
-            elif 'screenshot' in cmd:
-                result = self._take_screenshot()
-            elif 'sleep' in cmd or 'standby' in cmd:
-                result = self._power_control('sleep')
-            elif cmd in ['hello', 'hi', 'hey']:
-                result = {"success": True, "action": "greeting", "message": "Hello sir. Systems operational.", "data": None}
+            macro_name = self.macros.find(cmd)
+            if macro_name:
+                handler = '_play_macro'
+                result = self._play_macro(macro_name)
             else:
-                result = {"success": False, "action": "unknown", "message": f"I don't understand: '{cmd}'", "data": None}
-                
+                handler = '_handle_macro'
+                result = self._handle_macro(cmd)
+                if result is None:
+                    handler, args, confidence = self._resolve(cmd)
+                    result = getattr(self, handler)(*args)
+                    result.confidence = confidence
+                    if self.macros.recording is not None and result.success and handler != '_confirm_intent':
+                        self.macros.record(cmd, handler, args)
         except Exception as e:
-            result = {"success": False, "action": "error", "message": str(e), "data": None}
-            
+            result = CommandResult.fail(Intent.ERROR, str(e))
+        
+        result.handler = handler
+        result.elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
         self.last_result = result
         return result
     
-    def _handle_youtube(self, cmd: str) -> Dict:
+    def _resolve(self, cmd: str) -> Tuple[str, tuple, Optional[float]]:
+        """Keyword routing, with the intent classifier as fallback for misses"""
+        # Any reply other than a confirmation drops the pending question
+        pending, self.pending_intent = self.pending_intent, None
+        if pending and cmd in CONFIRM_WORDS and time.monotonic() < pending[2]:
+            handler, args = self._route(pending[0])
+            return handler, args, pending[1]
+        handler, args = self._route(cmd)
+        if handler != '_unknown':
+            return handler, args, None
+        guess = intent_classifier.classify(cmd)
+        if guess['confirm']:
+            return '_confirm_intent', (guess['command'], guess['confidence']), guess['confidence']
+        if guess['command']:
+            handler, args = self._route(guess['command'])
+        return handler, args, guess['confidence']
+    
+    def _route(self, cmd: str) -> Tuple[str, tuple]:
+        """Resolve a normalized command to (handler name, handler args)"""
+        # Command routing - ordered by priority
+        if 'youtube' in cmd or ('play' in cmd and ('video' in cmd or 'song' in cmd or 'music' in cmd)):
+            return '_handle_youtube', (cmd,)
+        elif 'go to' in cmd or 'visit' in cmd:
+            return '_open_website', (cmd,)
+        elif cmd.startswith('search google for') or cmd.startswith('google search'):
+            query = cmd.replace('search google for', '').replace('google search', '').strip()
+            return '_handle_google_search', (query,)
+        elif 'search' in cmd and 'google' in cmd:
+            query = cmd.replace('search', '').replace('google', '').replace('for', '').strip()
+            return '_handle_google_search', (query,)
+        elif any(x in cmd for x in ['open', 'start', 'launch']):
+            return '_open_app', (self._parse_app_name(cmd),)
+        elif cmd.startswith('close') or cmd.startswith('kill') or cmd.startswith('exit'):
+            return '_handle_close', (cmd,)
+        elif 'minimize all' in cmd or 'show desktop' in cmd:
+            return '_minimize_all', ()
+        elif 'snap' in cmd:
+            return '_snap_window', self._parse_snap(cmd)
+        elif 'brightness' in cmd:
+            return '_handle_brightness', (cmd,)
+        elif any(x in cmd for x in ['play', 'pause', 'music', 'media', 'skip', 'next track', 'previous track']) and 'youtube' not in cmd:
+            return '_handle_media', (cmd,)
+        elif 'lock' in cmd and 'system' in cmd:
+            return '_lock_system', ()
+        elif 'empty recycle' in cmd or 'empty bin' in cmd:
+            return '_empty_recycle_bin', ()
+        elif any(x in cmd for x in ['always on top', 'maximize window', 'minimize window', 'restore window']) and 'snap' not in cmd:
+            return '_handle_window_actions', (cmd,)
+        elif 'create folder' in cmd or 'new folder' in cmd:
+            return '_create_folder', (cmd,)
+        elif cmd.startswith('delete') or cmd.startswith('remove'):
+            return '_delete_file', (cmd,)
+        elif 'rename' in cmd and ' to ' in cmd:
+            return '_rename_file', (cmd,)
+        elif cmd.startswith('type') or cmd.startswith('write'):
+            return '_write_text', (cmd,)
+        elif cmd.startswith('press') or cmd.startswith('hit'):
+            return '_press_key', (cmd,)
+        elif re.search(r'\b(?:calculate|compute)\b', cmd) or (any(x in cmd for x in ['what is', 'how much']) and any(c in cmd for c in '0123456789+-*/')):
+            return '_calculate', (cmd,)
+        elif 'joke' in cmd:
+            return '_tell_joke', ()
+        elif 'weather' in cmd:
+            return '_get_weather', (cmd,)
+        elif any(x in cmd for x in ['shutdown', 'restart', 'reboot']) and 'abort' not in cmd:
+            return '_shutdown_system', (cmd,)
+        elif 'abort' in cmd or 'cancel shutdown' in cmd:
+            return '_abort_shutdown', ()
+        elif 'list processes' in cmd or 'running apps' in cmd:
+            return '_list_processes', ()
+        elif cmd.startswith('terminate') or (cmd.startswith('kill') and 'close' not in cmd):
+            return '_kill_process', (cmd,)
+        elif 'time' in cmd:
+            return '_get_time', ()
+        elif 'ip' in cmd or 'network' in cmd:
+            return '_get_network', ()
+        elif 'system info' in cmd:
+            return '_get_system_info', ()
+        elif 'copy' in cmd and cmd.split()[0] == 'copy':
+            return '_handle_clipboard', (cmd, 'copy')
+        elif 'paste' in cmd:
+            return '_handle_clipboard', (cmd, 'paste')
+        elif 'find' in cmd or 'search file' in cmd:
+            return '_search_files', (cmd,)
+        elif 'volume' in cmd or 'sound' in cmd:
+            return '_handle_volume', (cmd,)
+        elif 'screenshot' in cmd:
+            return '_take_screenshot', (cmd,)
+        elif 'sleep' in cmd or 'standby' in cmd:
+            return '_power_control', ('sleep',)
+        elif cmd in ['hello', 'hi', 'hey']:
+            return '_greeting', ()
+        return '_unknown', (cmd,)
+    
+    def _handle_macro(self, cmd: str) -> Optional[CommandResult]:
+        """Macro recording and playback commands, None if cmd is not one"""
+        match = re.match(r'^(?:record|start recording)\s+macro\s+(.+)$', cmd)
+        if match:
+            name = match.group(1).strip()
+            self.macros.start_recording(name)
+            return CommandResult.ok(Intent.MACRO, f"Recording macro '{name}'. Say 'stop recording' when done", {"name": name})
+        if cmd in ['stop recording', 'save macro']:
+            macro = self.macros.stop_recording()
+            if not macro:
+                return CommandResult.fail(Intent.MACRO, "Nothing recorded", ErrorCode.INVALID_INPUT)
+            return CommandResult.ok(Intent.MACRO, f"Saved macro with {len(macro['steps'])} steps. Say '{macro['trigger']}' to run it", {"trigger": macro['trigger'], "steps": len(macro['steps'])})
+        if cmd == 'cancel recording':
+            if self.macros.cancel_recording():
+                return CommandResult.ok(Intent.MACRO, "Recording cancelled")
+            return CommandResult.fail(Intent.MACRO, "Not recording", ErrorCode.INVALID_INPUT)
+        if cmd == 'list macros':
+            macros = self.macros.list_macros()
+            names = ', '.join(m['name'] for m in macros) or 'none'
+            return CommandResult.ok(Intent.MACRO, f"Macros: {names}", macros)
+        match = re.match(r'^(?:run|play)\s+macro\s+(.+?)(\s+with timing)?$', cmd)
+        if match:
+            return self._play_macro(match.group(1).strip(), timing=bool(match.group(2)))
+        match = re.match(r'^delete\s+macro\s+(.+)$', cmd)
+        if match:
+            name = match.group(1).strip()
+            if self.macros.delete(name):
+                return CommandResult.ok(Intent.MACRO, f"Deleted macro '{name}'")
+            return CommandResult.fail(Intent.MACRO, f"Macro '{name}' not found", ErrorCode.NOT_FOUND)
+        return None
+    
+    def _play_macro(self, name: str, timing: bool = False) -> CommandResult:
+        """Replay a recorded macro"""
+        if name not in self.macros.macros:
+            return CommandResult.fail(Intent.MACRO, f"Macro '{name}' not found", ErrorCode.NOT_FOUND)
+        report = self.macros.play(name, lambda handler: getattr(self, handler, None), timing=timing)
+        if report['success']:
+            message = f"Macro '{name}' completed {report['completed']} steps in {report['elapsed_ms']}ms"
+        else:
+            failed = report['steps'][-1]
+            message = f"Macro '{name}' stopped at step {report['completed']} ({failed['command']}): {failed['message']}"
+        return CommandResult(report['success'], Intent.MACRO, message, report,
+                             None if report['success'] else ErrorCode.EXECUTION_FAILED)
+    
+    def _greeting(self) -> CommandResult:
+        """Greeting"""
+        return CommandResult.ok(Intent.GREETING, "Hello sir. Systems operational.")
+    
+    def _unknown(self, cmd: str) -> CommandResult:
+        """Fallback for unrecognized commands"""
+        return CommandResult.fail(Intent.UNKNOWN, f"I don't understand: '{cmd}'", ErrorCode.UNKNOWN_COMMAND)
+    
+    def _confirm_intent(self, command: str, confidence: float) -> CommandResult:
+        """Ask before running a side-effecting intent the classifier is unsure of"""
+        self.pending_intent = (command, confidence, time.monotonic() + CONFIRM_TIMEOUT)
+        return CommandResult.ok(Intent.CONFIRM, f"Did you mean '{command}'? Say 'yes' to confirm",
+                                {"command": command})
+    
+    def _handle_youtube(self, cmd: str) -> CommandResult:
         """YouTube automation - search and play videos"""
         query = None
         
@@ -152,31 +299,21 @@ class JarvisCore:
             search_url = f"https://www.youtube.com/results?search_query={encoded_query}"
             webbrowser.open(search_url)
             
-            return {
-                "success": True, 
-                "action": "youtube", 
-                "message": f"Opening YouTube search for: '{query}'", 
-                "data": {"query": query, "url": search_url}
-            }
+            return CommandResult.ok(Intent.YOUTUBE, f"Opening YouTube search for: '{query}'", {"query": query, "url": search_url})
         else:
             webbrowser.open('https://www.youtube.com')
-            return {"success": True, "action": "youtube", "message": "YouTube opened", "data": None}
+            return CommandResult.ok(Intent.YOUTUBE, "YouTube opened")
     
-    def _handle_google_search(self, query: str) -> Dict:
+    def _handle_google_search(self, query: str) -> CommandResult:
         """Google search"""
         if query:
             encoded = urllib.parse.quote(query)
             url = f"https://www.google.com/search?q={encoded}"
             webbrowser.open(url)
-            return {
-                "success": True, 
-                "action": "search", 
-                "message": f"Searching Google for: '{query}'", 
-                "data": {"query": query, "url": url}
-            }
-        return {"success": False, "action": "search", "message": "No search query provided", "data": None}
+            return CommandResult.ok(Intent.SEARCH, f"Searching Google for: '{query}'", {"query": query, "url": url})
+        return CommandResult.fail(Intent.SEARCH, "No search query provided", ErrorCode.INVALID_INPUT)
     
-    def _open_website(self, cmd: str) -> Dict:
+    def _open_website(self, cmd: str) -> CommandResult:
         """Open specific websites by name or URL"""
         site = cmd.replace('go to', '').replace('visit', '').replace('open website', '').strip()
         
@@ -216,70 +353,41 @@ class JarvisCore:
         site_lower = site.lower()
         if site_lower in sites:
             webbrowser.open(sites[site_lower])
-            return {"success": True, "action": "website", "message": f"Opening {site}", "data": {"site": site, "url": sites[site_lower]}}
+            return CommandResult.ok(Intent.WEBSITE, f"Opening {site}", {"site": site, "url": sites[site_lower]})
         elif site.startswith('http://') or site.startswith('https://'):
             webbrowser.open(site)
-            return {"success": True, "action": "website", "message": f"Opening {site}", "data": {"url": site}}
+            return CommandResult.ok(Intent.WEBSITE, f"Opening {site}", {"url": site})
         elif any(ext in site for ext in ['.com', '.org', '.net', '.io', '.co', '.ai']):
             url = f"https://{site}" if not site.startswith('www.') else f"https://{site}"
             webbrowser.open(url)
-            return {"success": True, "action": "website", "message": f"Opening {site}", "data": {"url": url}}
+            return CommandResult.ok(Intent.WEBSITE, f"Opening {site}", {"url": url})
         else:
             return self._handle_google_search(site)
 
-    def _handle_open(self, cmd: str) -> Dict:
-        """Handle application opening"""
-        apps = {
-            'notepad': 'notepad.exe',
-            'calc': 'calc.exe',
-            'calculator': 'calc.exe',
-            'chrome': 'chrome.exe',
-            'browser': 'chrome.exe',
-            'edge': 'msedge.exe',
-            'firefox': 'firefox.exe',
-            'cmd': 'cmd.exe',
-            'command prompt': 'cmd.exe',
-            'powershell': 'powershell.exe',
-            'explorer': 'explorer.exe',
-            'files': 'explorer.exe',
-            'task manager': 'taskmgr.exe',
-            'paint': 'mspaint.exe',
-            'word': 'winword.exe',
-            'excel': 'excel.exe',
-            'spotify': 'spotify.exe',
-            'settings': 'ms-settings:',
-            'control panel': 'control.exe',
-            'vscode': 'code.exe',
-            'visual studio code': 'code.exe',
-            'vlc': 'vlc.exe',
-            'discord': 'discord.exe',
-            'steam': 'steam.exe'
-        }
-        
-        app_name = cmd
+    def _parse_app_name(self, cmd: str) -> str:
+        """App name from an open/start/launch command"""
         for keyword in ['open', 'start', 'launch']:
             if cmd.startswith(keyword):
-                app_name = cmd.replace(keyword, '').strip()
-                break
-            
-        if app_name in apps:
-            exe = apps[app_name]
-            try:
-                if exe.startswith('ms-'):
-                    os.system(f'start {exe}')
-                else:
-                    subprocess.Popen(exe, shell=True)
-                return {"success": True, "action": "open", "message": f"Opened {app_name}", "data": {"app": app_name}}
-            except Exception as e:
-                return {"success": False, "action": "open", "message": f"Failed to open {app_name}: {str(e)}", "data": None}
+                return cmd.replace(keyword, '').strip()
+        return cmd
+    
+    def _open_app(self, app_name: str) -> CommandResult:
+        """Handle application opening"""
+        target = APP_ALIASES.get(app_name, app_name)
+        if target.startswith('ms-'):
+            entry = {"kind": "uri", "target": target}
         else:
-            try:
-                subprocess.Popen(app_name, shell=True)
-                return {"success": True, "action": "open", "message": f"Executing {app_name}", "data": None}
-            except Exception as e:
-                return {"success": False, "action": "open", "message": f"Application '{app_name}' not found: {str(e)}", "data": None}
+            entry = app_catalog.resolve(target) or app_catalog.resolve(app_name)
+        if not entry:
+            return CommandResult.fail(Intent.OPEN, f"Application '{app_name}' not found", ErrorCode.NOT_FOUND)
+        
+        try:
+            app_catalog.launch(entry)
+            return CommandResult.ok(Intent.OPEN, f"Opened {app_name}", {"app": app_name, "target": entry.get('target') or entry['argv'][0]})
+        except Exception as e:
+            return CommandResult.fail(Intent.OPEN, f"Failed to open {app_name}: {str(e)}")
     
-    def _handle_close(self, cmd: str) -> Dict:
+    def _handle_close(self, cmd: str) -> CommandResult:
         """Close applications"""
         app_name = cmd.replace('close', '').replace('kill', '').replace('exit', '').strip()
         
@@ -293,36 +401,35 @@ class JarvisCore:
                 pass
         
         if closed:
-            return {"success": True, "action": "close", "message": f"Closed {', '.join(closed)}", "data": closed}
-        return {"success": False, "action": "close", "message": f"No process matching '{app_name}' found", "data": None}
+            return CommandResult.ok(Intent.CLOSE, f"Closed {', '.join(closed)}", closed)
+        return CommandResult.fail(Intent.CLOSE, f"No process matching '{app_name}' found", ErrorCode.NOT_FOUND)
     
-    def _minimize_all(self) -> Dict:
+    def _minimize_all(self) -> CommandResult:
         """Minimize all windows"""
         if not PYAUTOGUI_AVAILABLE:
-            return {"success": False, "action": "minimize_all", "message": "PyAutoGUI not installed", "data": None}
+            return CommandResult.fail(Intent.MINIMIZE_ALL, "PyAutoGUI not installed", ErrorCode.DEPENDENCY_MISSING)
             
         try:
             pyautogui.keyDown('win')
             pyautogui.keyDown('m')
             pyautogui.keyUp('m')
             pyautogui.keyUp('win')
-            return {"success": True, "action": "minimize_all", "message": "All windows minimized", "data": None}
+            return CommandResult.ok(Intent.MINIMIZE_ALL, "All windows minimized")
         except Exception as e:
-            return {"success": False, "action": "minimize_all", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.MINIMIZE_ALL, str(e))
     
-    def _handle_snap(self, cmd: str) -> Dict:
-        """Window snapping"""
-        if not WINDOWS_API_AVAILABLE:
-            return {"success": False, "action": "snap", "message": "Windows API not available", "data": None}
-            
+    def _parse_snap(self, cmd: str) -> Tuple[str, Optional[str]]:
+        """(direction, window name or None) from a snap command"""
         direction = 'left' if 'left' in cmd else 'right'
-        window_name = None
-        
-        parts = cmd.replace('snap', '').strip().split()
-        for part in parts:
+        for part in cmd.replace('snap', '').strip().split():
             if part not in ['left', 'right', 'window']:
-                window_name = part
-                break
+                return direction, part
+        return direction, None
+    
+    def _snap_window(self, direction: str, window_name: Optional[str] = None) -> CommandResult:
+        """Window snapping"""
+        if not WINDOWS_API_AVAILABLE:
+            return CommandResult.fail(Intent.SNAP, "Windows API not available", ErrorCode.UNSUPPORTED_PLATFORM)
         
         if not window_name:
             hwnd = win32gui.GetForegroundWindow()
@@ -340,7 +447,7 @@ class JarvisCore:
                 if handles:
                     hwnd = handles[0]
                 else:
-                    return {"success": False, "action": "snap", "message": f"Window '{window_name}' not found", "data": None}
+                    return CommandResult.fail(Intent.SNAP, f"Window '{window_name}' not found", ErrorCode.NOT_FOUND)
         
         try:
             screen_width = win32api.GetSystemMetrics(0)
@@ -353,28 +460,28 @@ class JarvisCore:
                 win32gui.SetWindowPos(hwnd, win32con.HWND_TOP, 
                                     screen_width//2, 0, screen_width//2, screen_height, 0)
             
-            return {"success": True, "action": "snap", "message": f"Snapped {window_name} to {direction}", "data": {"direction": direction, "window": window_name}}
+            return CommandResult.ok(Intent.SNAP, f"Snapped {window_name} to {direction}", {"direction": direction, "window": window_name})
         except Exception as e:
-            return {"success": False, "action": "snap", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.SNAP, str(e))
     
-    def _get_time(self) -> Dict:
+    def _get_time(self) -> CommandResult:
         """Get current time"""
         now = datetime.now()
         time_str = now.strftime("%I:%M %p")
         date_str = now.strftime("%A, %B %d, %Y")
-        return {"success": True, "action": "time", "message": f"It is {time_str} on {date_str}", "data": {"time": time_str, "date": date_str}}
+        return CommandResult.ok(Intent.TIME, f"It is {time_str} on {date_str}", {"time": time_str, "date": date_str})
     
-    def _get_network(self) -> Dict:
+    def _get_network(self) -> CommandResult:
         """Get IP info"""
         try:
             result = subprocess.run(['ipconfig'], capture_output=True, text=True, shell=True)
             lines = result.stdout.split('\n')
             ips = [line.split(':')[1].strip() for line in lines if 'IPv4' in line and ':' in line]
-            return {"success": True, "action": "network", "message": f"IP Addresses: {', '.join(ips[:2])}", "data": {"ips": ips}}
+            return CommandResult.ok(Intent.NETWORK, f"IP Addresses: {', '.join(ips[:2])}", {"ips": ips})
         except Exception as e:
-            return {"success": False, "action": "network", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.NETWORK, str(e))
     
-    def _get_system_info(self) -> Dict:
+    def _get_system_info(self) -> CommandResult:
         """Get system stats"""
         try:
             cpu = psutil.cpu_percent()
@@ -387,94 +494,91 @@ class JarvisCore:
                 "disk": f"{disk.percent}%"
             }
             
-            return {"success": True, "action": "system_info", 
-                    "message": f"CPU: {info['cpu']}, RAM: {info['memory']}, Disk: {info['disk']}", 
-                    "data": info}
+            return CommandResult.ok(Intent.SYSTEM_INFO, f"CPU: {info['cpu']}, RAM: {info['memory']}, Disk: {info['disk']}", info)
         except Exception as e:
-            return {"success": False, "action": "system_info", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.SYSTEM_INFO, str(e))
     
-    def _handle_clipboard(self, cmd: str, action: str) -> Dict:
+    def _handle_clipboard(self, cmd: str, action: str) -> CommandResult:
         """Clipboard operations"""
         if not PYPERCLIP_AVAILABLE:
-            return {"success": False, "action": "clipboard", "message": "Pyperclip not installed", "data": None}
+            return CommandResult.fail(Intent.CLIPBOARD, "Pyperclip not installed", ErrorCode.DEPENDENCY_MISSING)
             
         if action == 'copy':
             text = cmd.replace('copy', '').strip()
             pyperclip.copy(text)
-            return {"success": True, "action": "clipboard", "message": f"Copied: {text}", "data": {"text": text}}
+            return CommandResult.ok(Intent.CLIPBOARD, f"Copied: {text}", {"text": text})
         else:
             if not PYAUTOGUI_AVAILABLE:
-                return {"success": False, "action": "clipboard", "message": "PyAutoGUI not installed", "data": None}
+                return CommandResult.fail(Intent.CLIPBOARD, "PyAutoGUI not installed", ErrorCode.DEPENDENCY_MISSING)
             pyautogui.hotkey('ctrl', 'v')
-            return {"success": True, "action": "clipboard", "message": "Pasted from clipboard", "data": None}
+            return CommandResult.ok(Intent.CLIPBOARD, "Pasted from clipboard")
     
-    def _search_files(self, cmd: str) -> Dict:
+    def _search_files(self, cmd: str) -> CommandResult:
         """Search for files"""
         query = cmd.replace('find', '').replace('search file', '').strip()
-        matches = []
-        
-        search_paths = [
-            os.path.expanduser('~\\Desktop'),
-            os.path.expanduser('~\\Documents'),
-            os.path.expanduser('~\\Downloads')
-        ]
+        if not query:
+            return CommandResult.fail(Intent.SEARCH, "No search query provided", ErrorCode.INVALID_INPUT)
         
-        for path in search_paths:
-            if os.path.exists(path):
-                for root, dirs, files in os.walk(path):
-                    for item in files + dirs:
-                        if query.lower() in item.lower():
-                            matches.append(os.path.join(root, item))
-                    if len(matches) > 20:  # Limit results
-                        break
+        matches = [m['path'] for m in file_search.search(query)]
         
         if matches:
-            return {"success": True, "action": "search", "message": f"Found {len(matches)} matches", "data": matches[:5]}
-        return {"success": True, "action": "search", "message": "No files found", "data": []}
+            return CommandResult.ok(Intent.SEARCH, f"Found {len(matches)} matches", matches[:5])
+        return CommandResult.ok(Intent.SEARCH, "No files found", [])
     
-    def _handle_volume(self, cmd: str) -> Dict:
+    def _handle_volume(self, cmd: str) -> CommandResult:
         """Volume control"""
         if not PYAUTOGUI_AVAILABLE:
-            return {"success": False, "action": "volume", "message": "PyAutoGUI not installed", "data": None}
+            return CommandResult.fail(Intent.VOLUME, "PyAutoGUI not installed", ErrorCode.DEPENDENCY_MISSING)
             
         if 'up' in cmd or 'increase' in cmd:
             pyautogui.press('volumeup', presses=5)
-            return {"success": True, "action": "volume", "message": "Volume increased", "data": None}
+            return CommandResult.ok(Intent.VOLUME, "Volume increased")
         elif 'down' in cmd or 'decrease' in cmd:
             pyautogui.press('volumedown', presses=5)
-            return {"success": True, "action": "volume", "message": "Volume decreased", "data": None}
+            return CommandResult.ok(Intent.VOLUME, "Volume decreased")
         elif 'mute' in cmd:
             pyautogui.press('volumemute')
-            return {"success": True, "action": "volume", "message": "Volume muted", "data": None}
-        return {"success": False, "action": "volume", "message": "Specify up, down, or mute", "data": None}
+            return CommandResult.ok(Intent.VOLUME, "Volume muted")
+        return CommandResult.fail(Intent.VOLUME, "Specify up, down, or mute", ErrorCode.INVALID_INPUT)
     
-    def _take_screenshot(self) -> Dict:
-        """Screenshot"""
+    def _take_screenshot(self, cmd: str = '') -> CommandResult:
+        """Screenshot - full screen, active window or burst"""
         if not PYAUTOGUI_AVAILABLE:
-            return {"success": False, "action": "screenshot", "message": "PyAutoGUI not installed", "data": None}
+            return CommandResult.fail(Intent.SCREENSHOT, "PyAutoGUI not installed", ErrorCode.DEPENDENCY_MISSING)
             
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"jarvis_screenshot_{timestamp}.png"
-            pictures_dir = os.path.join(os.path.expanduser('~'), 'Pictures')
-            os.makedirs(pictures_dir, exist_ok=True)
-            filepath = os.path.join(pictures_dir, filename)
-            pyautogui.screenshot(filepath)
-            return {"success": True, "action": "screenshot", "message": f"Screenshot saved: {filename}", "data": {"path": filepath}}
+            fmt = next((f for f in ['jpeg', 'jpg', 'webp', 'png'] if f in cmd), None)
+            active_window = 'window' in cmd
+            
+            if 'burst' in cmd:
+                frames_match = re.search(r'(\d+)\s*(?:frames|shots|screenshots)', cmd)
+                fps_match = re.search(r'(\d+)\s*(?:fps|per second)', cmd)
+                frames = int(frames_match.group(1)) if frames_match else 10
+                fps = int(fps_match.group(1)) if fps_match else 5
+                job = screenshots.burst(fps=fps, frames=frames, fmt=fmt or 'jpg', active_window=active_window)
+                message = f"Capturing {job['frames']} screenshots in the background"
+                return CommandResult.ok(Intent.SCREENSHOT, message + scope_note(active_window, job['scope']),
+                                        {"job": job['id'], "scope": job['scope']})
+            
+            shot = screenshots.capture(fmt=fmt or 'png', active_window=active_window)
+            path = shot['paths'][0]
+            message = f"Saving screenshot: {os.path.basename(path)}"
+            return CommandResult.ok(Intent.SCREENSHOT, message + scope_note(active_window, shot['scope']),
+                                    {"job": shot['id'], "path": path, "scope": shot['scope']})
         except Exception as e:
-            return {"success": False, "action": "screenshot", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.SCREENSHOT, str(e))
     
-    def _power_control(self, action: str) -> Dict:
+    def _power_control(self, action: str) -> CommandResult:
         """Power controls"""
         if action == 'sleep':
             if self.os == 'Windows':
                 os.system("rundll32.exe powrprof.dll,SetSuspendState 0,1,0")
             else:
-                return {"success": False, "action": "power", "message": "Sleep only supported on Windows", "data": None}
-            return {"success": True, "action": "power", "message": "System sleeping", "data": None}
-        return {"success": False, "action": "power", "message": "Unknown power command", "data": None}
+                return CommandResult.fail(Intent.POWER, "Sleep only supported on Windows", ErrorCode.UNSUPPORTED_PLATFORM)
+            return CommandResult.ok(Intent.POWER, "System sleeping")
+        return CommandResult.fail(Intent.POWER, "Unknown power command", ErrorCode.INVALID_INPUT)
 
-    def _handle_brightness(self, cmd: str) -> Dict:
+    def _handle_brightness(self, cmd: str) -> CommandResult:
         """Screen brightness control"""
         try:
             import screen_brightness_control as sbc
@@ -482,106 +586,107 @@ class JarvisCore:
                 current = sbc.get_brightness()[0]
                 new_val = min(100, current + 10)
                 sbc.set_brightness(new_val)
-                return {"success": True, "action": "brightness", "message": f"Brightness increased to {new_val}%", "data": None}
+                return CommandResult.ok(Intent.BRIGHTNESS, f"Brightness increased to {new_val}%")
             elif 'down' in cmd or 'decrease' in cmd or 'lower' in cmd:
                 current = sbc.get_brightness()[0]
                 new_val = max(0, current - 10)
                 sbc.set_brightness(new_val)
-                return {"success": True, "action": "brightness", "message": f"Brightness decreased to {new_val}%", "data": None}
+                return CommandResult.ok(Intent.BRIGHTNESS, f"Brightness decreased to {new_val}%")
             elif 'max' in cmd:
                 sbc.set_brightness(100)
-                return {"success": True, "action": "brightness", "message": "Brightness set to maximum", "data": None}
+                return CommandResult.ok(Intent.BRIGHTNESS, "Brightness set to maximum")
             elif 'min' in cmd:
                 sbc.set_brightness(0)
-                return {"success": True, "action": "brightness", "message": "Brightness set to minimum", "data": None}
+                return CommandResult.ok(Intent.BRIGHTNESS, "Brightness set to minimum")
             elif 'set' in cmd:
                 match = re.search(r'\d+', cmd)
                 if match:
                     num = int(match.group())
                     sbc.set_brightness(num)
-                    return {"success": True, "action": "brightness", "message": f"Brightness set to {num}%", "data": None}
+                    return CommandResult.ok(Intent.BRIGHTNESS, f"Brightness set to {num}%")
+                return CommandResult.fail(Intent.BRIGHTNESS, "Specify a brightness level", ErrorCode.INVALID_INPUT)
             else:
                 current = sbc.get_brightness()[0]
-                return {"success": True, "action": "brightness", "message": f"Current brightness: {current}%", "data": None}
+                return CommandResult.ok(Intent.BRIGHTNESS, f"Current brightness: {current}%")
         except ImportError:
-            return {"success": False, "action": "brightness", "message": "Install screen_brightness_control: pip install screen-brightness-control", "data": None}
+            return CommandResult.fail(Intent.BRIGHTNESS, "Install screen_brightness_control: pip install screen-brightness-control", ErrorCode.DEPENDENCY_MISSING)
         except Exception as e:
-            return {"success": False, "action": "brightness", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.BRIGHTNESS, str(e))
 
-    def _handle_media(self, cmd: str) -> Dict:
+    def _handle_media(self, cmd: str) -> CommandResult:
         """Media controls"""
         if not PYAUTOGUI_AVAILABLE:
-            return {"success": False, "action": "media", "message": "PyAutoGUI not installed", "data": None}
+            return CommandResult.fail(Intent.MEDIA, "PyAutoGUI not installed", ErrorCode.DEPENDENCY_MISSING)
             
         if 'play' in cmd or 'pause' in cmd:
             pyautogui.press('playpause')
-            return {"success": True, "action": "media", "message": "Play/Pause toggled", "data": None}
+            return CommandResult.ok(Intent.MEDIA, "Play/Pause toggled")
         elif 'next' in cmd or 'skip' in cmd:
             pyautogui.press('nexttrack')
-            return {"success": True, "action": "media", "message": "Next track", "data": None}
+            return CommandResult.ok(Intent.MEDIA, "Next track")
         elif 'previous' in cmd or 'back' in cmd:
             pyautogui.press('prevtrack')
-            return {"success": True, "action": "media", "message": "Previous track", "data": None}
+            return CommandResult.ok(Intent.MEDIA, "Previous track")
         elif 'stop' in cmd:
             pyautogui.press('stop')
-            return {"success": True, "action": "media", "message": "Stopped", "data": None}
-        return {"success": False, "action": "media", "message": "Unknown media command", "data": None}
+            return CommandResult.ok(Intent.MEDIA, "Stopped")
+        return CommandResult.fail(Intent.MEDIA, "Unknown media command", ErrorCode.INVALID_INPUT)
 
-    def _lock_system(self) -> Dict:
+    def _lock_system(self) -> CommandResult:
         """Lock workstation"""
         if self.os != 'Windows':
-            return {"success": False, "action": "lock", "message": "Lock only supported on Windows", "data": None}
+            return CommandResult.fail(Intent.LOCK, "Lock only supported on Windows", ErrorCode.UNSUPPORTED_PLATFORM)
         try:
             ctypes.windll.user32.LockWorkStation()
-            return {"success": True, "action": "lock", "message": "System locked", "data": None}
+            return CommandResult.ok(Intent.LOCK, "System locked")
         except Exception as e:
-            return {"success": False, "action": "lock", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.LOCK, str(e))
 
-    def _empty_recycle_bin(self) -> Dict:
+    def _empty_recycle_bin(self) -> CommandResult:
         """Empty recycle bin"""
         if self.os != 'Windows':
-            return {"success": False, "action": "recycle", "message": "Recycle bin only on Windows", "data": None}
+            return CommandResult.fail(Intent.RECYCLE, "Recycle bin only on Windows", ErrorCode.UNSUPPORTED_PLATFORM)
         try:
             import winshell
             winshell.recycle_bin().empty(confirm=False, show_progress=False, sound=False)
-            return {"success": True, "action": "recycle", "message": "Recycle bin emptied", "data": None}
+            return CommandResult.ok(Intent.RECYCLE, "Recycle bin emptied")
         except ImportError:
             try:
                 os.system("rd /s /q %systemdrive%\\$Recycle.Bin 2>nul")
-                return {"success": True, "action": "recycle", "message": "Recycle bin emptied", "data": None}
+                return CommandResult.ok(Intent.RECYCLE, "Recycle bin emptied")
             except Exception as e:
-                return {"success": False, "action": "recycle", "message": str(e), "data": None}
+                return CommandResult.fail(Intent.RECYCLE, str(e))
 
-    def _handle_window_actions(self, cmd: str) -> Dict:
+    def _handle_window_actions(self, cmd: str) -> CommandResult:
         """Advanced window actions"""
         if not WINDOWS_API_AVAILABLE:
-            return {"success": False, "action": "window", "message": "Windows API not available", "data": None}
+            return CommandResult.fail(Intent.WINDOW, "Windows API not available", ErrorCode.UNSUPPORTED_PLATFORM)
             
         if 'always on top' in cmd and 'cancel' not in cmd:
             hwnd = win32gui.GetForegroundWindow()
             win32gui.SetWindowPos(hwnd, win32con.HWND_TOPMOST, 0, 0, 0, 0, 
                                 win32con.SWP_NOMOVE | win32con.SWP_NOSIZE)
-            return {"success": True, "action": "window", "message": "Window set to always on top", "data": None}
+            return CommandResult.ok(Intent.WINDOW, "Window set to always on top")
         elif 'cancel always on top' in cmd or 'normal window' in cmd:
             hwnd = win32gui.GetForegroundWindow()
             win32gui.SetWindowPos(hwnd, win32con.HWND_NOTOPMOST, 0, 0, 0, 0,
                                 win32con.SWP_NOMOVE | win32con.SWP_NOSIZE)
-            return {"success": True, "action": "window", "message": "Always on top cancelled", "data": None}
+            return CommandResult.ok(Intent.WINDOW, "Always on top cancelled")
         elif 'maximize' in cmd:
             hwnd = win32gui.GetForegroundWindow()
             win32gui.ShowWindow(hwnd, win32con.SW_MAXIMIZE)
-            return {"success": True, "action": "window", "message": "Window maximized", "data": None}
+            return CommandResult.ok(Intent.WINDOW, "Window maximized")
         elif 'minimize' in cmd and 'all' not in cmd:
             hwnd = win32gui.GetForegroundWindow()
             win32gui.ShowWindow(hwnd, win32con.SW_MINIMIZE)
-            return {"success": True, "action": "window", "message": "Window minimized", "data": None}
+            return CommandResult.ok(Intent.WINDOW, "Window minimized")
         elif 'restore' in cmd:
             hwnd = win32gui.GetForegroundWindow()
             win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-            return {"success": True, "action": "window", "message": "Window restored", "data": None}
-        return {"success": False, "action": "window", "message": "Unknown window command", "data": None}
+            return CommandResult.ok(Intent.WINDOW, "Window restored")
+        return CommandResult.fail(Intent.WINDOW, "Unknown window command", ErrorCode.INVALID_INPUT)
 
-    def _create_folder(self, cmd: str) -> Dict:
+    def _create_folder(self, cmd: str) -> CommandResult:
         """Create new folder"""
         try:
             folder_name = cmd.replace('create folder', '').replace('new folder', '').strip()
@@ -590,11 +695,11 @@ class JarvisCore:
             
             path = os.path.join(os.path.expanduser('~\\Desktop'), folder_name)
             os.makedirs(path, exist_ok=True)
-            return {"success": True, "action": "folder", "message": f"Created folder: {folder_name}", "data": {"path": path}}
+            return CommandResult.ok(Intent.FOLDER, f"Created folder: {folder_name}", {"path": path})
         except Exception as e:
-            return {"success": False, "action": "folder", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.FOLDER, str(e))
 
-    def _delete_file(self, cmd: str) -> Dict:
+    def _delete_file(self, cmd: str) -> CommandResult:
         """Delete file/folder"""
         try:
             import shutil
@@ -610,13 +715,13 @@ class JarvisCore:
                     shutil.rmtree(filepath)
                 else:
                     os.remove(filepath)
-                return {"success": True, "action": "delete", "message": f"Deleted: {os.path.basename(filepath)}", "data": None}
+                return CommandResult.ok(Intent.DELETE, f"Deleted: {os.path.basename(filepath)}")
             else:
-                return {"success": False, "action": "delete", "message": "File not found", "data": None}
+                return CommandResult.fail(Intent.DELETE, "File not found", ErrorCode.NOT_FOUND)
         except Exception as e:
-            return {"success": False, "action": "delete", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.DELETE, str(e))
 
-    def _rename_file(self, cmd: str) -> Dict:
+    def _rename_file(self, cmd: str) -> CommandResult:
         """Rename file"""
         try:
             parts = cmd.replace('rename', '').strip().split(' to ')
@@ -630,27 +735,27 @@ class JarvisCore:
                 
                 new_path = os.path.join(os.path.dirname(old_path), new_name)
                 os.rename(old_path, new_path)
-                return {"success": True, "action": "rename", "message": f"Renamed to {new_name}", "data": None}
-            return {"success": False, "action": "rename", "message": "Usage: rename [file] to [newname]", "data": None}
+                return CommandResult.ok(Intent.RENAME, f"Renamed to {new_name}")
+            return CommandResult.fail(Intent.RENAME, "Usage: rename [file] to [newname]", ErrorCode.INVALID_INPUT)
         except Exception as e:
-            return {"success": False, "action": "rename", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.RENAME, str(e))
 
-    def _write_text(self, cmd: str) -> Dict:
+    def _write_text(self, cmd: str) -> CommandResult:
         """Type text using keyboard"""
         if not PYAUTOGUI_AVAILABLE:
-            return {"success": False, "action": "type", "message": "PyAutoGUI not installed", "data": None}
+            return CommandResult.fail(Intent.TYPE, "PyAutoGUI not installed", ErrorCode.DEPENDENCY_MISSING)
             
         try:
             text = cmd.replace('type', '').replace('write', '').strip()
             pyautogui.typewrite(text, interval=0.01)
-            return {"success": True, "action": "type", "message": f"Typed: {text}", "data": None}
+            return CommandResult.ok(Intent.TYPE, f"Typed: {text}")
         except Exception as e:
-            return {"success": False, "action": "type", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.TYPE, str(e))
 
-    def _press_key(self, cmd: str) -> Dict:
+    def _press_key(self, cmd: str) -> CommandResult:
         """Press specific keys"""
         if not PYAUTOGUI_AVAILABLE:
-            return {"success": False, "action": "keypress", "message": "PyAutoGUI not installed", "data": None}
+            return CommandResult.fail(Intent.KEYPRESS, "PyAutoGUI not installed", ErrorCode.DEPENDENCY_MISSING)
             
         try:
             key = cmd.replace('press', '').replace('hit', '').strip()
@@ -664,29 +769,29 @@ class JarvisCore:
             else:
                 pyautogui.press(key)
             
-            return {"success": True, "action": "keypress", "message": f"Pressed {key}", "data": None}
+            return CommandResult.ok(Intent.KEYPRESS, f"Pressed {key}")
         except Exception as e:
-            return {"success": False, "action": "keypress", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.KEYPRESS, str(e))
 
-    def _calculate(self, cmd: str) -> Dict:
+    def _calculate(self, cmd: str) -> CommandResult:
         """Calculator - SAFER implementation"""
         try:
             expression = cmd.replace('calculate', '').replace('compute', '').replace('what is', '').strip()
             # Only allow numbers and basic operators
             allowed_chars = set('0123456789+-*/(). ')
             if not all(c in allowed_chars for c in expression):
-                return {"success": False, "action": "calculate", "message": "Invalid characters in expression", "data": None}
+                return CommandResult.fail(Intent.CALCULATE, "Invalid characters in expression", ErrorCode.INVALID_INPUT)
             
             # Safer evaluation using literal_eval for simple math
             try:
                 result = eval(expression, {"__builtins__": {}}, {})
-                return {"success": True, "action": "calculate", "message": f"{expression} = {result}", "data": {"result": result, "expression": expression}}
+                return CommandResult.ok(Intent.CALCULATE, f"{expression} = {result}", {"result": result, "expression": expression})
             except:
-                return {"success": False, "action": "calculate", "message": "Invalid expression", "data": None}
+                return CommandResult.fail(Intent.CALCULATE, "Invalid expression", ErrorCode.INVALID_INPUT)
         except Exception as e:
-            return {"success": False, "action": "calculate", "message": f"Error: {str(e)}", "data": None}
+            return CommandResult.fail(Intent.CALCULATE, f"Error: {str(e)}")
 
-    def _tell_joke(self) -> Dict:
+    def _tell_joke(self) -> CommandResult:
         """Random joke"""
         jokes = [
             "Why do programmers prefer dark mode? Because light attracts bugs.",
@@ -697,33 +802,33 @@ class JarvisCore:
             "Why do Java developers wear glasses? Because they don't C#."
         ]
         joke = random.choice(jokes)
-        return {"success": True, "action": "joke", "message": joke, "data": None}
+        return CommandResult.ok(Intent.JOKE, joke)
 
-    def _get_weather(self, cmd: str) -> Dict:
+    def _get_weather(self, cmd: str) -> CommandResult:
         """Get weather"""
-        return {"success": True, "action": "weather", "message": "Weather API not configured. Add OpenWeatherMap API key to enable.", "data": None}
+        return CommandResult.ok(Intent.WEATHER, "Weather API not configured. Add OpenWeatherMap API key to enable.")
 
-    def _shutdown_system(self, cmd: str) -> Dict:
+    def _shutdown_system(self, cmd: str) -> CommandResult:
         """Shutdown or restart"""
         if self.os != 'Windows':
-            return {"success": False, "action": "power", "message": "Shutdown only supported on Windows", "data": None}
+            return CommandResult.fail(Intent.POWER, "Shutdown only supported on Windows", ErrorCode.UNSUPPORTED_PLATFORM)
             
         if 'restart' in cmd or 'reboot' in cmd:
             os.system('shutdown /r /t 10 /c "JARVIS restarting system as requested"')
-            return {"success": True, "action": "power", "message": "Restarting in 10 seconds...", "data": None}
+            return CommandResult.ok(Intent.POWER, "Restarting in 10 seconds...")
         elif 'shutdown' in cmd or 'turn off' in cmd:
             os.system('shutdown /s /t 10 /c "JARVIS shutting down system as requested"')
-            return {"success": True, "action": "power", "message": "Shutting down in 10 seconds... Say 'abort shutdown' to cancel", "data": None}
-        return {"success": False, "action": "power", "message": "Specify shutdown or restart", "data": None}
+            return CommandResult.ok(Intent.POWER, "Shutting down in 10 seconds... Say 'abort shutdown' to cancel")
+        return CommandResult.fail(Intent.POWER, "Specify shutdown or restart", ErrorCode.INVALID_INPUT)
 
-    def _abort_shutdown(self) -> Dict:
+    def _abort_shutdown(self) -> CommandResult:
         """Cancel shutdown"""
         if self.os != 'Windows':
-            return {"success": False, "action": "power", "message": "Only supported on Windows", "data": None}
+            return CommandResult.fail(Intent.POWER, "Only supported on Windows", ErrorCode.UNSUPPORTED_PLATFORM)
         os.system("shutdown /a")
-        return {"success": True, "action": "power", "message": "Shutdown aborted", "data": None}
+        return CommandResult.ok(Intent.POWER, "Shutdown aborted")
 
-    def _list_processes(self) -> Dict:
+    def _list_processes(self) -> CommandResult:
         """List running processes"""
         try:
             processes = []
@@ -735,11 +840,11 @@ class JarvisCore:
                     pass
             
             top = processes[:10] if processes else ["No active processes found"]
-            return {"success": True, "action": "processes", "message": f"Top processes: {', '.join(top)}", "data": top}
+            return CommandResult.ok(Intent.PROCESSES, f"Top processes: {', '.join(top)}", top)
         except Exception as e:
-            return {"success": False, "action": "processes", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.PROCESSES, str(e))
 
-    def _kill_process(self, cmd: str) -> Dict:
+    def _kill_process(self, cmd: str) -> CommandResult:
         """Kill process by name or PID"""
         try:
             target = cmd.replace('kill', '').replace('terminate', '').strip()
@@ -748,7 +853,7 @@ class JarvisCore:
             try:
                 pid = int(target)
                 psutil.Process(pid).terminate()
-                return {"success": True, "action": "kill", "message": f"Killed process {pid}", "data": None}
+                return CommandResult.ok(Intent.KILL, f"Killed process {pid}")
             except ValueError:
                 # Try as name
                 killed = []
@@ -758,10 +863,10 @@ class JarvisCore:
                         killed.append(proc.info['name'])
                 
                 if killed:
-                    return {"success": True, "action": "kill", "message": f"Killed: {', '.join(killed)}", "data": None}
-                return {"success": False, "action": "kill", "message": "Process not found", "data": None}
+                    return CommandResult.ok(Intent.KILL, f"Killed: {', '.join(killed)}")
+                return CommandResult.fail(Intent.KILL, "Process not found", ErrorCode.NOT_FOUND)
         except Exception as e:
-            return {"success": False, "action": "kill", "message": str(e), "data": None}
+            return CommandResult.fail(Intent.KILL, str(e))
 
 # Singleton instance
 jarvis = JarvisCore()
\ No newline at end of file
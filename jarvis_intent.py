@@ -0,0 +1,227 @@
+"""
+J.A.R.V.I.S. fallback intent classifier
+Hashed char n-gram TF-IDF with nearest-neighbour scoring over a bundled corpus
+"""
+
+import os
+import json
+import zlib
+import hashlib
+import threading
+from typing import Dict, Any, List, Optional
+
+# Optional imports with fallbacks
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+CORPUS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'intent_corpus.json')
+MODEL_DIR = os.path.join(os.path.expanduser('~'), '.jarvis')
+
+N_FEATURES = 1 << 13
+# Bumped when the model file layout changes, forcing a retrain
+MODEL_VERSION = 2
+NGRAM_RANGE = (2, 4)
+# Calibrated with evaluate() on the corpus' holdout (39 paraphrases) and
+# negatives (43 out-of-scope requests). Training examples score 1.0; the
+# highest negative is 0.62 ("what's running on port 80"). At these settings
+# no negative is accepted, 22 of 39 holdout phrases are and none with the
+# wrong intent.
+DEFAULT_THRESHOLD = 0.65
+# Best intent must beat the runner-up by this much
+MIN_MARGIN = 0.1
+# Intents marked "confirm" in the corpus below this score ask first
+CONFIRM_THRESHOLD = 0.8
+
+
+def ngram_ids(text: str) -> List[int]:
+    """Hashed character n-grams of a space-padded, lowercased utterance"""
+    padded = f" {' '.join(text.lower().split())} "
+    ids = []
+    lo, hi = NGRAM_RANGE
+    for n in range(lo, hi + 1):
+        for i in range(len(padded) - n + 1):
+            # crc32 rather than hash() so ids are stable across processes
+            ids.append(zlib.crc32(padded[i:i + n].encode('utf-8')) & (N_FEATURES - 1))
+    return ids
+
+
+class IntentClassifier:
+    def __init__(self, corpus_path: str = CORPUS_FILE, model_dir: str = MODEL_DIR,
+                 threshold: float = DEFAULT_THRESHOLD, min_margin: float = MIN_MARGIN,
+                 confirm_threshold: float = CONFIRM_THRESHOLD):
+        self.corpus_path = corpus_path
+        self.model_path = os.path.join(model_dir, 'intent_model.npy')
+        self.meta_path = os.path.join(model_dir, 'intent_model.json')
+        self.threshold = threshold
+        self.min_margin = min_margin
+        self.confirm_threshold = confirm_threshold
+        self.labels: List[str] = []
+        self.commands: List[str] = []
+        # Side-effecting intents that need a higher score or a spoken "yes"
+        self.confirm: set = set()
+        # First training row of each intent in the model's columns
+        self.offsets = None
+        self.model = None
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        return NUMPY_AVAILABLE and os.path.isfile(self.corpus_path)
+
+    def load(self) -> bool:
+        """Memory-map the trained model, retraining if the corpus changed"""
+        if self.model is not None:
+            return True
+        if not self.available:
+            return False
+        with self._lock:
+            if self.model is not None:
+                return True
+            with open(self.corpus_path, 'rb') as f:
+                raw = f.read()
+            digest = hashlib.sha1(raw).hexdigest()
+            meta = self._read_meta()
+            if meta is None or meta.get('corpus') != digest or meta.get('n_features') != N_FEATURES \
+                    or meta.get('version') != MODEL_VERSION or not os.path.isfile(self.model_path):
+                meta = self.train(json.loads(raw.decode('utf-8')), digest)
+            self.labels = meta['labels']
+            self.commands = meta['commands']
+            self.confirm = set(meta.get('confirm', []))
+            self.offsets = np.asarray(meta['offsets'], dtype=np.int64)
+            # Plain ndarray view of the mapping skips np.memmap's per-index overhead
+            self.model = np.asarray(np.load(self.model_path, mmap_mode='r'))
+            return True
+
+    def train(self, corpus: Dict[str, Any], digest: str = '') -> Dict[str, Any]:
+        """Fit idf and keep every training utterance as a TF-IDF row.
+
+        Only corpus['intents'] is trained on; 'holdout' and 'negatives' are
+        kept for evaluate().
+        """
+        corpus = corpus['intents']
+        labels = sorted(corpus)
+        commands = [corpus[label]['command'] for label in labels]
+        utterances, offsets = [], []
+        for label in labels:
+            offsets.append(len(utterances))
+            # The canonical command counts as a training utterance too
+            utterances.extend([corpus[label]['command']] + corpus[label]['examples'])
+
+        tf = self._dense_counts(utterances)
+        df = np.count_nonzero(tf, axis=0).astype(np.float32)
+        idf = np.log((1.0 + len(utterances)) / (1.0 + df)).astype(np.float32) + 1.0
+        x = self._normalize(tf * idf)
+
+        os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
+        tmp = self.model_path + '.tmp.npy'
+        # One row per feature: [idf, weight in each training utterance], so
+        # scoring only touches the rows of the n-grams an utterance actually has
+        np.save(tmp, np.ascontiguousarray(np.vstack([idf[None, :], x]).T, dtype=np.float32))
+        os.replace(tmp, self.model_path)
+        meta = {"labels": labels, "commands": commands, "offsets": offsets, "corpus": digest,
+                "n_features": N_FEATURES, "version": MODEL_VERSION,
+                "confirm": [label for label in labels if corpus[label].get('confirm')]}
+        with open(self.meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        return meta
+
+    def classify_batch(self, utterances: List[str]) -> List[Dict[str, Any]]:
+        """Best intent per utterance with its confidence and margin.
+
+        intent/command are None unless the top score clears the threshold
+        and beats the runner-up by min_margin. confirm is set for
+        side-effecting intents scoring below confirm_threshold.
+        """
+        if not utterances or not self.load():
+            return [self._result(None, 0.0, 0.0) for _ in utterances]
+        scores = self._scores(utterances)
+        top2 = np.argsort(scores, axis=1)[:, -2:]
+        results = []
+        for row in range(len(utterances)):
+            second, best = top2[row]
+            confidence = min(1.0, float(scores[row, best]))
+            margin = confidence - float(scores[row, second])
+            accepted = confidence >= self.threshold and margin >= self.min_margin
+            results.append(self._result(best if accepted else None, confidence, margin))
+        return results
+
+    def classify(self, utterance: str) -> Dict[str, Any]:
+        return self.classify_batch([utterance])[0]
+
+    def evaluate(self) -> Dict[str, Any]:
+        """Accept rates on the corpus' held-out positives and negatives"""
+        if not self.load():
+            return {}
+        with open(self.corpus_path, 'r', encoding='utf-8') as f:
+            corpus = json.load(f)
+        holdout = [(label, text) for label, texts in corpus.get('holdout', {}).items() for text in texts]
+        negatives = corpus.get('negatives', [])
+        positives = self.classify_batch([text for _, text in holdout])
+        rejected = self.classify_batch(negatives)
+        return {
+            "holdout": len(holdout),
+            "holdout_correct": sum(r['intent'] == label for (label, _), r in zip(holdout, positives)),
+            "holdout_wrong": [(text, r['intent']) for (label, text), r in zip(holdout, positives)
+                              if r['intent'] not in (None, label)],
+            "negatives": len(negatives),
+            "false_accepts": [(text, r['intent'], round(r['confidence'], 3), r['confirm'])
+                              for text, r in zip(negatives, rejected) if r['intent']]
+        }
+
+    def _result(self, index: Optional[int], confidence: float, margin: float) -> Dict[str, Any]:
+        label = self.labels[index] if index is not None else None
+        return {"intent": label,
+                "command": self.commands[index] if index is not None else None,
+                "confidence": confidence,
+                "margin": margin,
+                "confirm": label in self.confirm and confidence < self.confirm_threshold}
+
+    def _read_meta(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _scores(self, utterances: List[str]):
+        """Best cosine similarity of each utterance to each intent's training rows"""
+        keys, counts = np.unique(self._flat_ids(utterances), return_counts=True)
+        owners, ids = np.divmod(keys, N_FEATURES)
+        gathered = self.model[ids]
+        weights = np.log1p(counts).astype(np.float32) * gathered[:, 0]
+        norms = np.sqrt(np.bincount(owners, weights * weights, minlength=len(utterances)))
+        weights /= norms[owners]
+        # keys are sorted, so each utterance's n-grams form one contiguous run
+        starts = np.searchsorted(owners, np.arange(len(utterances)))
+        rows = np.add.reduceat(weights[:, None] * gathered[:, 1:], starts, axis=0)
+        # Nearest neighbour per intent: a paraphrase only has to match one
+        # example, not the average of all of them
+        return np.maximum.reduceat(rows, self.offsets, axis=1)
+
+    @staticmethod
+    def _flat_ids(utterances: List[str]):
+        flat = []
+        for row, text in enumerate(utterances):
+            offset = row * N_FEATURES
+            flat.extend(offset + i for i in ngram_ids(text))
+        return np.asarray(flat, dtype=np.int64)
+
+    def _dense_counts(self, utterances: List[str]):
+        counts = np.bincount(self._flat_ids(utterances), minlength=len(utterances) * N_FEATURES)
+        tf = counts.reshape(len(utterances), N_FEATURES).astype(np.float32)
+        # Sublinear tf damps repeated n-grams in long utterances
+        np.log1p(tf, out=tf)
+        return tf
+
+    @staticmethod
+    def _normalize(x):
+        norms = np.linalg.norm(x, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return x / norms
+
+
+# Shared classifier used by JarvisCore
+intent_classifier = IntentClassifier()
@@ -0,0 +1,179 @@
+"""
+J.A.R.V.I.S. macros
+Record command sequences and replay them in compiled form
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Dict, Any, List, Optional, Callable, Tuple, Set
+from jarvis_result import CommandResult, Intent, ErrorCode
+
+MACRO_FILE = os.path.join(os.path.expanduser('~'), '.jarvis', 'macros.json')
+
+
+class MacroManager:
+    def __init__(self, handlers: Optional[Set[str]] = None, path: str = MACRO_FILE):
+        self.path = path
+        # Handler names a step may reference; None accepts any
+        self.handlers = handlers
+        self.macros: Dict[str, Dict[str, Any]] = {}
+        self.triggers: Dict[str, str] = {}
+        self.recording: Optional[Dict[str, Any]] = None
+        # name -> [(bound handler, args, delay, command)], built on first playback
+        self._compiled: Dict[str, List[Tuple[Callable, tuple, float, str]]] = {}
+        self._lock = threading.Lock()
+        self._last_step = 0.0
+        self.load()
+
+    def load(self):
+        """Load saved macros from disk"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            saved = {}
+        if not isinstance(saved, dict):
+            print(f"[Macros] {self.path} is not a macro mapping; ignoring it")
+            saved = {}
+        self.macros = {}
+        for name, macro in saved.items():
+            if self._well_formed(macro):
+                self.macros[name] = macro
+            else:
+                print(f"[Macros] '{name}' is malformed; skipping it")
+        self.triggers = {m['trigger']: name for name, m in self.macros.items()}
+        self._compiled.clear()
+        for name, macro in self.macros.items():
+            stale = [s['handler'] for s in macro['steps'] if not self._valid(s['handler'])]
+            if stale:
+                print(f"[Macros] '{name}' references unknown handlers {stale}; re-record it")
+
+    @staticmethod
+    def _well_formed(macro: Any) -> bool:
+        """Has the fields load(), compile() and list_macros() rely on"""
+        if not isinstance(macro, dict) or not isinstance(macro.get('trigger'), str) \
+                or not isinstance(macro.get('steps'), list):
+            return False
+        return all(isinstance(step, dict) and isinstance(step.get('handler'), str)
+                   and isinstance(step.get('command'), str) and isinstance(step.get('args'), list)
+                   and isinstance(step.get('delay'), (int, float))
+                   for step in macro['steps'])
+
+    def _valid(self, handler: str) -> bool:
+        return self.handlers is None or handler in self.handlers
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.macros, f, indent=2)
+        os.replace(tmp, self.path)
+
+    def start_recording(self, name: str, trigger: Optional[str] = None):
+        with self._lock:
+            self.recording = {"name": name, "trigger": trigger or name, "steps": []}
+            self._last_step = time.perf_counter()
+
+    def record(self, command: str, handler: str, args: tuple):
+        """Append an already-routed command to the macro being recorded"""
+        with self._lock:
+            if self.recording is None:
+                return
+            now = time.perf_counter()
+            delay = round(now - self._last_step, 3) if self.recording['steps'] else 0.0
+            self._last_step = now
+            self.recording['steps'].append({"command": command, "handler": handler,
+                                            "args": list(args), "delay": delay})
+
+    def stop_recording(self) -> Optional[Dict[str, Any]]:
+        """Finish recording and persist the macro. Returns None if nothing was recorded."""
+        with self._lock:
+            macro, self.recording = self.recording, None
+            if not macro or not macro['steps']:
+                return None
+            name = macro.pop('name')
+            old = self.macros.get(name)
+            if old:
+                self.triggers.pop(old['trigger'], None)
+            self.macros[name] = macro
+            self.triggers[macro['trigger']] = name
+            self._compiled.pop(name, None)
+            self.save()
+            return macro
+
+    def cancel_recording(self) -> bool:
+        with self._lock:
+            was_recording, self.recording = self.recording is not None, None
+            return was_recording
+
+    def delete(self, name: str) -> bool:
+        with self._lock:
+            macro = self.macros.pop(name, None)
+            if macro is None:
+                return False
+            self.triggers.pop(macro['trigger'], None)
+            self._compiled.pop(name, None)
+            self.save()
+            return True
+
+    def find(self, phrase: str) -> Optional[str]:
+        """Macro name triggered by an exact voice phrase"""
+        return self.triggers.get(phrase)
+
+    def compile(self, name: str, resolver: Callable[[str], Callable]) -> List[Tuple[Callable, tuple, float, str]]:
+        """Resolve each step's handler once and cache the bound callables.
+
+        Steps whose handler no longer exists compile to a callable that fails.
+        """
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            compiled = []
+            for step in self.macros[name]['steps']:
+                handler = resolver(step['handler']) if self._valid(step['handler']) else None
+                if handler is None:
+                    handler = self._stale_step(step['handler'])
+                compiled.append((handler, tuple(step['args']), step['delay'], step['command']))
+            self._compiled[name] = compiled
+        return compiled
+
+    @staticmethod
+    def _stale_step(handler: str) -> Callable:
+        def fail(*args):
+            return CommandResult.fail(Intent.MACRO, f"Step handler '{handler}' no longer exists; re-record the macro",
+                                      ErrorCode.NOT_FOUND)
+        return fail
+
+    def play(self, name: str, resolver: Callable[[str], Callable], timing: bool = False,
+             abort_on_failure: bool = True) -> Dict[str, Any]:
+        """Replay a macro, returning per-step results and latencies"""
+        started = time.perf_counter()
+        try:
+            steps = self.compile(name, resolver)
+        except (KeyError, TypeError) as e:
+            failed = {"command": None, "success": False, "message": f"Macro file is malformed: {e}", "latency_ms": 0.0}
+            return {"success": False, "steps": [failed], "completed": 0, "total": 0, "elapsed_ms": 0.0}
+        report = []
+        ok = True
+        for handler, args, delay, command in steps:
+            if timing and delay > 0:
+                time.sleep(delay)
+            t0 = time.perf_counter()
+            try:
+                result = handler(*args)
+            except Exception as e:
+                result = CommandResult.fail(Intent.ERROR, str(e))
+            latency = round((time.perf_counter() - t0) * 1000, 2)
+            report.append({"command": command, "success": result.success,
+                           "message": result.message, "latency_ms": latency})
+            if not result.success:
+                ok = False
+                if abort_on_failure:
+                    break
+        return {"success": ok, "steps": report, "completed": len(report), "total": len(steps),
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)}
+
+    def list_macros(self) -> List[Dict[str, Any]]:
+        return [{"name": name, "trigger": m['trigger'], "steps": [s['command'] for s in m['steps']]}
+                for name, m in self.macros.items()]
@@ -0,0 +1,104 @@
+"""
+J.A.R.V.I.S. command results
+Compact result type shared by all handlers, with a fast JSON path
+"""
+
+import json
+from enum import Enum
+from typing import Dict, Any, Optional
+
+
+class Intent(str, Enum):
+    YOUTUBE = 'youtube'
+    SEARCH = 'search'
+    WEBSITE = 'website'
+    OPEN = 'open'
+    CLOSE = 'close'
+    MINIMIZE_ALL = 'minimize_all'
+    SNAP = 'snap'
+    TIME = 'time'
+    NETWORK = 'network'
+    SYSTEM_INFO = 'system_info'
+    CLIPBOARD = 'clipboard'
+    VOLUME = 'volume'
+    SCREENSHOT = 'screenshot'
+    POWER = 'power'
+    BRIGHTNESS = 'brightness'
+    MEDIA = 'media'
+    LOCK = 'lock'
+    RECYCLE = 'recycle'
+    WINDOW = 'window'
+    FOLDER = 'folder'
+    DELETE = 'delete'
+    RENAME = 'rename'
+    TYPE = 'type'
+    KEYPRESS = 'keypress'
+    CALCULATE = 'calculate'
+    JOKE = 'joke'
+    WEATHER = 'weather'
+    PROCESSES = 'processes'
+    KILL = 'kill'
+    MACRO = 'macro'
+    CLASSIFY = 'classify'
+    CONFIRM = 'confirm'
+    GREETING = 'greeting'
+    UNKNOWN = 'unknown'
+    ERROR = 'error'
+
+
+class ErrorCode(str, Enum):
+    DEPENDENCY_MISSING = 'dependency_missing'
+    UNSUPPORTED_PLATFORM = 'unsupported_platform'
+    NOT_FOUND = 'not_found'
+    INVALID_INPUT = 'invalid_input'
+    EXECUTION_FAILED = 'execution_failed'
+    UNKNOWN_COMMAND = 'unknown_command'
+
+
+# Compact separators, no sort; enums serialize as their str value
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+class CommandResult:
+    __slots__ = ('success', 'action', 'message', 'data', 'error', 'handler', 'elapsed_ms', 'confidence')
+
+    def __init__(self, success: bool, action: Intent, message: str, data: Any = None,
+                 error: Optional[ErrorCode] = None):
+        self.success = success
+        self.action = action
+        self.message = message
+        self.data = data
+        self.error = error
+        self.handler = None
+        self.elapsed_ms = None
+        self.confidence = None
+
+    @classmethod
+    def ok(cls, action: Intent, message: str, data: Any = None) -> 'CommandResult':
+        return cls(True, action, message, data)
+
+    @classmethod
+    def fail(cls, action: Intent, message: str, error: ErrorCode = ErrorCode.EXECUTION_FAILED,
+             data: Any = None) -> 'CommandResult':
+        return cls(False, action, message, data, error)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "success": self.success,
+            "action": self.action.value,
+            "message": self.message,
+            "data": self.data,
+            "error": self.error.value if self.error else None,
+            "handler": self.handler,
+            "elapsed_ms": self.elapsed_ms,
+            "confidence": self.confidence
+        }
+
+    def to_json(self, **extra) -> str:
+        payload = self.to_dict()
+        if extra:
+            payload.update(extra)
+        return _encoder.encode(payload)
+
+    def __repr__(self) -> str:
+        return f"CommandResult(success={self.success}, action={self.action.value}, message={self.message!r})"
@@ -0,0 +1,259 @@
+"""
+J.A.R.V.I.S. screenshot pipeline
+In-memory capture with PNG/JPEG/WebP encoding on a worker pool
+"""
+
+import os
+import io
+import time
+import uuid
+import base64
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+# Optional imports with fallbacks
+try:
+    import pyautogui
+    PYAUTOGUI_AVAILABLE = True
+except ImportError:
+    PYAUTOGUI_AVAILABLE = False
+
+try:
+    import win32gui
+    WINDOWS_API_AVAILABLE = True
+except ImportError:
+    WINDOWS_API_AVAILABLE = False
+
+FORMATS = {
+    'png': ('PNG', 'image/png'),
+    'jpg': ('JPEG', 'image/jpeg'),
+    'jpeg': ('JPEG', 'image/jpeg'),
+    'webp': ('WEBP', 'image/webp')
+}
+
+MAX_BURST_FRAMES = 60
+# base64 bursts are held in the job until read, so keep them short
+MAX_MEMORY_BURST_FRAMES = 10
+MAX_JOBS = 50
+# Finished or not, jobs older than this are dropped
+JOB_TTL = 600.0
+
+
+def scope_note(active_window: bool, scope: str) -> str:
+    """Suffix for messages when an active window capture fell back"""
+    if active_window and scope != 'window':
+        return f" (active window unavailable, captured the {'region' if scope == 'region' else 'full screen'})"
+    return ""
+
+
+class ScreenshotService:
+    def __init__(self, workers: int = 2, compress_level: int = 6, quality: int = 85):
+        self.compress_level = compress_level
+        self.quality = quality
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='jarvis-encode')
+        self.output_dir = os.path.join(os.path.expanduser('~'), 'Pictures')
+        # job id -> status of background writes and bursts, oldest evicted first
+        self.jobs: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._jobs_lock = threading.Lock()
+
+    def resolve_region(self, region: Optional[Tuple[int, int, int, int]],
+                       active_window: bool) -> Tuple[Optional[Tuple[int, int, int, int]], str]:
+        """Region to grab and what it covers: 'window', 'region' or 'screen'.
+
+        An active window request falls back to the region or full screen when
+        the window can't be found (always, off Windows).
+        """
+        if active_window:
+            window = self.active_window_region()
+            if window:
+                return window, 'window'
+        return region, 'region' if region else 'screen'
+
+    def active_window_region(self) -> Optional[Tuple[int, int, int, int]]:
+        """(left, top, width, height) of the foreground window"""
+        if not WINDOWS_API_AVAILABLE:
+            return None
+        left, top, right, bottom = win32gui.GetWindowRect(win32gui.GetForegroundWindow())
+        if right <= left or bottom <= top:
+            return None
+        return (left, top, right - left, bottom - top)
+
+    def grab(self, region: Optional[Tuple[int, int, int, int]] = None):
+        """Capture the screen (or a region) into a PIL image, no encoding"""
+        if not PYAUTOGUI_AVAILABLE:
+            raise RuntimeError("PyAutoGUI not installed")
+        return pyautogui.screenshot(region=region) if region else pyautogui.screenshot()
+
+    def encode(self, image, fmt: str = 'png', compress_level: Optional[int] = None,
+               quality: Optional[int] = None) -> bytes:
+        """Encode a captured image to bytes"""
+        pil_format, _ = FORMATS[fmt]
+        buf = io.BytesIO()
+        if pil_format == 'PNG':
+            level = self.compress_level if compress_level is None else compress_level
+            image.save(buf, format='PNG', compress_level=max(0, min(9, level)))
+        else:
+            if pil_format == 'JPEG' and image.mode != 'RGB':
+                image = image.convert('RGB')
+            quality = self.quality if quality is None else quality
+            image.save(buf, format=pil_format, quality=max(0, min(100, quality)))
+        return buf.getvalue()
+
+    def encode_async(self, image, fmt: str = 'png', compress_level: Optional[int] = None,
+                     quality: Optional[int] = None) -> Future:
+        return self.pool.submit(self.encode, image, fmt, compress_level, quality)
+
+    def capture(self, fmt: str = 'png', region: Optional[Tuple[int, int, int, int]] = None,
+                active_window: bool = False, output: str = 'file',
+                compress_level: Optional[int] = None, quality: Optional[int] = None) -> Dict[str, Any]:
+        """Capture a single frame.
+
+        output='file' returns a pending job as soon as the frame is grabbed;
+        encoding and writing finish on the pool and update the job. 'bytes'
+        and 'base64' wait for the encoded image and return it in memory.
+        """
+        fmt = self._check_format(fmt)
+        region, scope = self.resolve_region(region, active_window)
+        image = self.grab(region)
+        timestamp = datetime.now()
+
+        if output == 'file':
+            path = self._target_path(timestamp, fmt)
+            job = self._new_job('capture', [path], scope=scope)
+            future = self.pool.submit(self._encode_to_file, image, path, fmt, compress_level, quality)
+            future.add_done_callback(lambda f: self._finish_job(job['id'], f))
+            return dict(job, format=fmt, size=image.size)
+
+        data = self.encode(image, fmt, compress_level, quality)
+        return dict(self._package(data, fmt, image.size, output, timestamp), scope=scope)
+
+    def burst(self, fps: float = 5, frames: int = 10, fmt: str = 'jpg',
+              region: Optional[Tuple[int, int, int, int]] = None, active_window: bool = False,
+              output: str = 'file', compress_level: Optional[int] = None,
+              quality: Optional[int] = None) -> Dict[str, Any]:
+        """Start a burst of `frames` frames at `fps` in the background.
+
+        Returns the job immediately; poll get_job() for the paths or images.
+        In-memory images are handed out once and then released.
+        """
+        fmt = self._check_format(fmt)
+        cap = MAX_BURST_FRAMES if output == 'file' else MAX_MEMORY_BURST_FRAMES
+        frames = max(1, min(cap, int(frames)))
+        region, scope = self.resolve_region(region, active_window)
+        job = self._new_job('burst', [], frames=frames, scope=scope)
+        threading.Thread(target=self._run_burst, name='jarvis-burst', daemon=True,
+                         args=(job['id'], fps, frames, fmt, region, output, compress_level, quality)).start()
+        return job
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._jobs_lock:
+            self._expire_jobs()
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            snapshot = dict(job)
+            if job.get('images'):
+                # The caller now owns the frames; don't keep megabytes per job
+                job['images'] = []
+                job['images_released'] = True
+            return snapshot
+
+    def _run_burst(self, job_id: str, fps: float, frames: int, fmt: str,
+                   region: Optional[Tuple[int, int, int, int]], output: str,
+                   compress_level: Optional[int], quality: Optional[int]):
+        interval = 1.0 / fps if fps > 0 else 0
+        pending = []
+        try:
+            next_tick = time.perf_counter()
+            for _ in range(frames):
+                image = self.grab(region)
+                timestamp = datetime.now()
+                if output == 'file':
+                    path = self._target_path(timestamp, fmt)
+                    future = self.pool.submit(self._encode_to_file, image, path, fmt, compress_level, quality)
+                else:
+                    path = None
+                    future = self.encode_async(image, fmt, compress_level, quality)
+                pending.append((future, image.size, timestamp, path))
+                next_tick += interval
+                delay = next_tick - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+            results = []
+            for future, size, timestamp, path in pending:
+                data = future.result()
+                if path:
+                    results.append(path)
+                else:
+                    results.append(self._package(data, fmt, size, output, timestamp))
+            self._update_job(job_id, status='done', paths=results if output == 'file' else [],
+                             images=[] if output == 'file' else results)
+        except Exception as e:
+            self._update_job(job_id, status='failed', error=str(e))
+
+    def _check_format(self, fmt: str) -> str:
+        fmt = fmt.lower()
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format: {fmt}")
+        return fmt
+
+    def _new_job(self, kind: str, paths: List[str], **extra) -> Dict[str, Any]:
+        job = {"id": uuid.uuid4().hex, "kind": kind, "status": "pending", "paths": paths,
+               "error": None, "created": time.time()}
+        job.update(extra)
+        with self._jobs_lock:
+            self._expire_jobs()
+            self.jobs[job['id']] = job
+            while len(self.jobs) > MAX_JOBS:
+                self.jobs.popitem(last=False)
+        return dict(job)
+
+    def _expire_jobs(self):
+        """Drop jobs past JOB_TTL; caller holds _jobs_lock"""
+        cutoff = time.time() - JOB_TTL
+        # Insertion order is creation order, so expired jobs are at the front
+        while self.jobs and next(iter(self.jobs.values()))['created'] < cutoff:
+            self.jobs.popitem(last=False)
+
+    def _update_job(self, job_id: str, **fields):
+        with self._jobs_lock:
+            if job_id in self.jobs:
+                self.jobs[job_id].update(fields)
+
+    def _finish_job(self, job_id: str, future: Future):
+        error = future.exception()
+        if error is not None:
+            print(f"[Screenshot] write failed: {error}")
+            self._update_job(job_id, status='failed', error=str(error))
+        else:
+            self._update_job(job_id, status='done')
+
+    def _target_path(self, timestamp: datetime, fmt: str) -> str:
+        os.makedirs(self.output_dir, exist_ok=True)
+        filename = f"jarvis_screenshot_{timestamp.strftime('%Y%m%d_%H%M%S_%f')}.{fmt}"
+        return os.path.join(self.output_dir, filename)
+
+    def _encode_to_file(self, image, path: str, fmt: str, compress_level: Optional[int],
+                        quality: Optional[int]) -> str:
+        data = self.encode(image, fmt, compress_level, quality)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    @staticmethod
+    def _package(data: bytes, fmt: str, size, output: str, timestamp: datetime) -> Dict[str, Any]:
+        item = {"format": fmt, "mime": FORMATS[fmt][1], "size": size,
+                "bytes": len(data), "timestamp": timestamp.isoformat()}
+        if output == 'base64':
+            item["image"] = base64.b64encode(data).decode('ascii')
+        else:
+            item["raw"] = data
+        return item
+
+
+# Shared service used by JarvisCore and the API server
+screenshots = ScreenshotService()
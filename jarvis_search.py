@@ -0,0 +1,126 @@
+"""
+J.A.R.V.I.S. live file search
+Concurrent os.scandir walker with ignore rules, depth limit and early stop
+"""
+
+import os
+import fnmatch
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+DEFAULT_IGNORE = [
+    '.git', '.svn', '.hg', 'node_modules', '__pycache__', '.cache',
+    '.venv', 'venv', '.tox', '.mypy_cache', '.pytest_cache', '.idea',
+    '.vscode', 'dist', 'build', '$RECYCLE.BIN', 'AppData', '*.tmp', '~$*'
+]
+
+
+def default_roots() -> List[str]:
+    """Desktop, Documents and Downloads of the current user"""
+    home = os.path.expanduser('~')
+    return [os.path.join(home, name) for name in ('Desktop', 'Documents', 'Downloads')]
+
+
+class LiveFileSearch:
+    def __init__(self, roots: Optional[List[str]] = None, ignore: Optional[List[str]] = None,
+                 max_depth: int = 6, limit: int = 20, workers: int = 4):
+        self.roots = roots if roots is not None else default_roots()
+        self.ignore = ignore if ignore is not None else list(DEFAULT_IGNORE)
+        self.max_depth = max_depth
+        self.limit = limit
+        self.workers = workers
+        # Plain names are checked with a set lookup, only real globs go through fnmatch
+        self._ignore_names = {p.lower() for p in self.ignore if not any(c in p for c in '*?[')}
+        self._ignore_globs = [p.lower() for p in self.ignore if any(c in p for c in '*?[')]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Search all roots concurrently and stop at `limit` matches.
+
+        Results are the best of the matches found before the stop, ordered by
+        score then mtime; the breadth-first walk finds shallow files first, so
+        a better match deeper in the tree can be missed.
+        """
+        query = query.lower().strip()
+        if not query:
+            return []
+        limit = limit or self.limit
+        roots = [r for r in self.roots if os.path.isdir(r)]
+        if not roots:
+            return []
+
+        results = []
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        def collect(item: Dict[str, Any]):
+            with lock:
+                results.append(item)
+                # Every worker checks the event, so the whole search ends here
+                if len(results) >= limit:
+                    stop.set()
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(roots))) as pool:
+            for future in [pool.submit(self._walk, root, query, collect, stop) for root in roots]:
+                future.result()
+
+        results.sort(key=lambda item: (item['score'], item['mtime']), reverse=True)
+        return results[:limit]
+
+    def _ignored(self, name: str) -> bool:
+        lower = name.lower()
+        if lower in self._ignore_names:
+            return True
+        return any(fnmatch.fnmatchcase(lower, pattern) for pattern in self._ignore_globs)
+
+    def _walk(self, root: str, query: str, collect, stop: threading.Event):
+        """Breadth-first scandir walk of one root"""
+        queue = deque([(root, 0)])
+        while queue and not stop.is_set():
+            path, depth = queue.popleft()
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if stop.is_set():
+                            return
+                        name = entry.name
+                        if self._ignored(name):
+                            continue
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        score = self._score(name, query)
+                        if score:
+                            try:
+                                mtime = entry.stat(follow_symlinks=False).st_mtime
+                            except OSError:
+                                mtime = 0.0
+                            collect({"path": os.path.join(path, name), "name": name,
+                                     "is_dir": is_dir, "score": score, "mtime": mtime})
+                        if is_dir and depth < self.max_depth:
+                            queue.append((entry.path, depth + 1))
+            except OSError:
+                continue
+
+    @staticmethod
+    def _score(name: str, query: str) -> int:
+        """Match quality: exact > exact stem > prefix > word start > substring"""
+        lower = name.lower()
+        if query not in lower:
+            return 0
+        if lower == query:
+            return 5
+        if os.path.splitext(lower)[0] == query:
+            return 4
+        if lower.startswith(query):
+            return 3
+        idx = lower.find(query)
+        if not lower[idx - 1].isalnum():
+            return 2
+        return 1
+
+
+# Shared engine used by JarvisCore
+file_search = LiveFileSearch()
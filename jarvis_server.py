@@ -4,15 +4,29 @@ J.A.R.V.I.S. Flask API Server
 REST API for voice and web interfaces
 """
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, send_from_directory, Response
 from flask_cors import CORS
 from jarvis_core import jarvis
+from jarvis_screenshot import screenshots, scope_note, FORMATS
+from jarvis_coalesce import CommandCoalescer, DEFAULT_WINDOW
+from jarvis_intent import intent_classifier
+from jarvis_result import CommandResult, Intent, ErrorCode
 import os
 import time
 
 app = Flask(__name__, static_folder='.')
 CORS(app)
 
+# Duplicate utterances (double speech results, retries) share one execution
+coalescer = CommandCoalescer(
+    jarvis.process_command,
+    window=float(os.environ.get('JARVIS_COALESCE_WINDOW', DEFAULT_WINDOW))
+)
+
+def respond(result: CommandResult, status: int = 200, **extra) -> Response:
+    """Serialize a CommandResult so every endpoint shares one schema"""
+    return Response(result.to_json(**extra), status=status, mimetype='application/json')
+
 @app.route('/')
 def index():
     return send_from_directory('.', 'index.html')
@@ -21,22 +35,108 @@ def index():
 def command():
     data = request.json
     if not data or 'command' not in data:
-        return jsonify({"success": False, "message": "No command provided"}), 400
+        return respond(CommandResult.fail(Intent.ERROR, "No command provided", ErrorCode.INVALID_INPUT), 400)
         
     cmd = data.get('command', '')
+    client = str(data.get('client_id') or request.remote_addr)
     
     print(f"\n[Command] {cmd}")
-    result = jarvis.process_command(cmd)
-    print(f"[Result] {result['message']}")
+    result, coalesced = coalescer.submit(client, cmd)
+    if coalesced:
+        print("[Coalesced] duplicate of a recent command")
+        return respond(result, coalesced=True)
+    
+    print(f"[Result] {result.message}")
+    return respond(result)
+
+@app.route('/api/screenshot', methods=['GET', 'POST'])
+def screenshot():
+    """Capture the screen, a region or the active window.
+    
+    Params: format (png/jpg/webp), output (bytes/base64/file),
+    region ("x,y,w,h"), active_window, compress_level, quality,
+    burst frames + fps.
+    """
+    params = dict(request.args)
+    params.update(request.get_json(silent=True) or {})
+    
+    fmt = str(params.get('format', 'png')).lower()
+    output = str(params.get('output', 'base64')).lower()
+    if fmt not in FORMATS or output not in ('bytes', 'base64', 'file'):
+        return respond(CommandResult.fail(Intent.SCREENSHOT, "Invalid format or output", ErrorCode.INVALID_INPUT), 400)
     
-    return jsonify(result)
+    region = params.get('region')
+    try:
+        if isinstance(region, str):
+            region = tuple(int(v) for v in region.split(','))
+        elif region is not None:
+            region = tuple(int(v) for v in region)
+        if region is not None and len(region) != 4:
+            raise ValueError
+        compress_level = int(params['compress_level']) if 'compress_level' in params else None
+        quality = int(params['quality']) if 'quality' in params else None
+        frames = int(params.get('frames', 1))
+        fps = float(params.get('fps', 5))
+    except (TypeError, ValueError):
+        return respond(CommandResult.fail(Intent.SCREENSHOT, "Invalid numeric parameter", ErrorCode.INVALID_INPUT), 400)
+    active_window = str(params.get('active_window', '')).lower() in ('1', 'true', 'yes')
+    
+    try:
+        if frames > 1:
+            if output == 'bytes':
+                return respond(CommandResult.fail(Intent.SCREENSHOT, "Burst mode supports base64 or file output",
+                                                  ErrorCode.INVALID_INPUT), 400)
+            job = screenshots.burst(fps=fps, frames=frames, fmt=fmt, region=region,
+                                    active_window=active_window, output=output,
+                                    compress_level=compress_level, quality=quality)
+            message = f"Capturing {job['frames']} screenshots"
+            return respond(CommandResult.ok(Intent.SCREENSHOT, message + scope_note(active_window, job['scope']), job), 202)
+        
+        shot = screenshots.capture(fmt=fmt, region=region, active_window=active_window, output=output,
+                                   compress_level=compress_level, quality=quality)
+        if output == 'bytes':
+            return Response(shot['raw'], mimetype=shot['mime'])
+        return respond(CommandResult.ok(Intent.SCREENSHOT, "Screenshot captured" + scope_note(active_window, shot['scope']), shot))
+    except Exception as e:
+        return respond(CommandResult.fail(Intent.SCREENSHOT, str(e)), 500)
+
+@app.route('/api/screenshot/<job_id>', methods=['GET'])
+def screenshot_job(job_id):
+    """Status of a background screenshot write or burst"""
+    job = screenshots.get_job(job_id)
+    if job is None:
+        return respond(CommandResult.fail(Intent.SCREENSHOT, "Unknown screenshot job", ErrorCode.NOT_FOUND), 404)
+    if job['status'] == 'failed':
+        return respond(CommandResult.fail(Intent.SCREENSHOT, job['error'] or "Screenshot failed", data=job))
+    return respond(CommandResult.ok(Intent.SCREENSHOT, job['status'], job))
+
+@app.route('/api/classify', methods=['POST'])
+def classify():
+    """Batch intent classification, for tuning the corpus"""
+    data = request.get_json(silent=True) or {}
+    utterances = data.get('utterances')
+    if not isinstance(utterances, list) or not all(isinstance(u, str) for u in utterances):
+        return respond(CommandResult.fail(Intent.CLASSIFY, "Provide a list of utterances", ErrorCode.INVALID_INPUT), 400)
+    if not intent_classifier.load():
+        return respond(CommandResult.fail(Intent.CLASSIFY, "Intent classifier unavailable (pip install numpy)",
+                                          ErrorCode.DEPENDENCY_MISSING), 503)
+    
+    results = intent_classifier.classify_batch(utterances)
+    data = [{"utterance": u, **result} for u, result in zip(utterances, results)]
+    return respond(CommandResult.ok(Intent.CLASSIFY, f"Classified {len(data)} utterances", data))
+
+@app.route('/api/macros', methods=['GET'])
+def macros():
+    macros = jarvis.macros.list_macros()
+    return respond(CommandResult.ok(Intent.MACRO, f"{len(macros)} macros", macros))
 
 @app.route('/api/status', methods=['GET'])
 def status():
     return jsonify({
         "status": "online",
         "version": "2.0",
-        "timestamp": time.time()
+        "timestamp": time.time(),
+        "coalescer": coalescer.get_stats()
     })
 
 @app.route('/api/history', methods=['GET'])
@@ -17,7 +17,7 @@ try {
 
 # Install dependencies
 Write-Host "Installing dependencies..." -ForegroundColor Yellow
-pip install flask flask-cors psutil pyautogui pyperclip pywin32
+pip install flask flask-cors psutil pyautogui pyperclip pywin32 numpy
 
 # Create files (in real setup, these would be copied)
 Write-Host "Creating system files..." -ForegroundColor Yellow